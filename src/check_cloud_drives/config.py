@@ -3,6 +3,8 @@
 Author: Rich Lewis - @RichLewis007
 """
 
+import os
+from contextlib import contextmanager
 from pathlib import Path
 
 import tomli_w
@@ -22,6 +24,12 @@ class ConfigManager:
     def __init__(self, config_path: Path):
         self.config_path = config_path
         self.config = self._load_config()
+        # Setter saves are deferred while inside batch()
+        self._batch_depth = 0
+        self._save_pending = False
+        self._batch_durable = False
+        # Set once the parent directory is known to exist, to skip mkdir on later saves
+        self._dir_ensured = False
 
     def _load_config(self) -> dict:
         """Load configuration from TOML file."""
@@ -46,7 +54,13 @@ class ConfigManager:
         }
 
     def _prepare_for_toml(self, data: dict) -> dict:
-        """Prepare config data for TOML serialization (handle None values and empty dicts)."""
+        """Prepare config data for TOML serialization (handle None values and empty dicts).
+
+        Parts that need no changes (flat dicts of scalars, lists without dicts)
+        are returned as-is rather than copied; the result is only read by tomli_w.
+        """
+        if not any(v is None or isinstance(v, (dict, list)) for v in data.values()):
+            return data
         result = {}
         for key, value in data.items():
             if value is None:
@@ -60,25 +74,83 @@ class ConfigManager:
                 if prepared or key == "window_geometry":
                     result[key] = prepared
             elif isinstance(value, list):
-                result[key] = [
-                    self._prepare_for_toml(item) if isinstance(item, dict) else item
-                    for item in value
-                ]
+                if any(isinstance(item, dict) for item in value):
+                    result[key] = [
+                        self._prepare_for_toml(item) if isinstance(item, dict) else item
+                        for item in value
+                    ]
+                else:
+                    result[key] = value
             else:
                 result[key] = value
         return result
 
-    def save_config(self):
-        """Save configuration to TOML file."""
+    def save_config(self, durable: bool = False):
+        """Save configuration to TOML file.
+
+        The file is written to a temporary sibling and renamed over the config,
+        so a crash mid-write never leaves a truncated file. With durable=True the
+        data (and, on POSIX, the rename) is also fsynced; that is reserved for
+        shutdown so ordinary saves don't wait on the disk.
+        """
+        tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
         try:
             # Ensure parent directory exists
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            # Prepare config for TOML (handle None values)
-            toml_data = self._prepare_for_toml(self.config)
-            with open(self.config_path, "wb") as f:
-                tomli_w.dump(toml_data, f)
+            if not self._dir_ensured:
+                self.config_path.parent.mkdir(parents=True, exist_ok=True)
+                self._dir_ensured = True
+            # Prepare config for TOML (handle None values) and serialize before
+            # touching the disk, so a bad value never leaves a temp file behind
+            data = tomli_w.dumps(self._prepare_for_toml(self.config)).encode()
+            try:
+                f = open(tmp_path, "wb")
+            except FileNotFoundError:
+                # The directory was removed since it was ensured; recreate it once
+                self.config_path.parent.mkdir(parents=True, exist_ok=True)
+                f = open(tmp_path, "wb")
+            with f:
+                f.write(data)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_path)
+            if durable and os.name == "posix":
+                # Persist the rename itself
+                dir_fd = os.open(self.config_path.parent, os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
         except Exception as e:
             print(f"Error saving config: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    @contextmanager
+    def batch(self, durable: bool = False):
+        """Collapse the saves of setters called inside the block into one save.
+
+        The file is written once when the outermost batch exits, and only if a
+        setter ran (or durable=True was requested by any level, in which case
+        the write is fsynced).
+        """
+        self._batch_depth += 1
+        self._batch_durable = self._batch_durable or durable
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                durable, self._batch_durable = self._batch_durable, False
+                if self._save_pending or durable:
+                    self._save_pending = False
+                    self.save_config(durable=durable)
+
+    def _save_or_defer(self):
+        """Save now, or mark a save as pending when inside batch()."""
+        if self._batch_depth:
+            self._save_pending = True
+        else:
+            self.save_config()
 
     def get_drives(self) -> list[DriveConfig]:
         """Get list of configured drives."""
@@ -87,7 +159,7 @@ class ConfigManager:
     def set_drives(self, drives: list[DriveConfig]):
         """Set list of configured drives."""
         self.config["drives"] = [d.to_dict() for d in drives]
-        self.save_config()
+        self._save_or_defer()
 
     def get_drive_order(self) -> list[str]:
         """Get the order of drive remote names."""
@@ -96,7 +168,7 @@ class ConfigManager:
     def set_drive_order(self, order: list[str]):
         """Set the order of drive remote names."""
         self.config["drive_order"] = order
-        self.save_config()
+        self._save_or_defer()
 
     def get_window_geometry(self) -> dict | None:
         """Get saved window geometry."""
@@ -110,7 +182,7 @@ class ConfigManager:
         """Save window geometry."""
         # Convert None to empty dict for TOML compatibility
         self.config["window_geometry"] = geometry if geometry else {}
-        self.save_config()
+        self._save_or_defer()
 
     def get_stay_on_top(self) -> bool:
         """Get stay on top setting."""
@@ -119,4 +191,4 @@ class ConfigManager:
     def set_stay_on_top(self, value: bool):
         """Set stay on top setting."""
         self.config["stay_on_top"] = value
-        self.save_config()
+        self._save_or_defer()
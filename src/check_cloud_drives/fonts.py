@@ -3,34 +3,37 @@
 Author: Rich Lewis - @RichLewis007
 """
 
-import atexit
 import zipfile
 from pathlib import Path
 
+from PySide6.QtCore import QByteArray
 from PySide6.QtGui import QFontDatabase
 
-# Store extracted font file paths to keep them alive for the application lifetime
-_extracted_font_files: list[Path] = []
+# Family of the bundled font used throughout the UI
+APP_FONT_FAMILY = "AtkynsonMono Nerd Font Propo"
 
 
-def _cleanup_font_files():
-    """Clean up extracted font files on application exit."""
-    for font_path in _extracted_font_files:
-        try:
-            if font_path.exists():
-                font_path.unlink()
-        except Exception:
-            pass  # Ignore errors during cleanup
-
+def _add_font_data(data: bytes, font_name: str) -> bool:
+    """Register font file contents with Qt's font database straight from memory."""
+    font_id = QFontDatabase.addApplicationFontFromData(QByteArray(data))
+    if font_id == -1:
+        print(f"Failed to load font: {font_name}")
+        return False
 
-# Register cleanup function to run on exit
-atexit.register(_cleanup_font_files)
+    # Verify font was loaded by checking font families
+    if QFontDatabase.applicationFontFamilies(font_id):
+        return True
+    print(f"Font loaded but no families found: {font_name}")
+    return False
 
 
 def load_font_from_zip(zip_path: Path, font_name_in_zip: str) -> bool:
     """
     Load a font file from a zip archive into Qt's font database.
 
+    The font is read into memory and registered from there, so nothing is
+    extracted to disk.
+
     Args:
         zip_path: Path to the zip file containing fonts
         font_name_in_zip: Name of the font file inside the zip (e.g., "AtkynsonMonoNerdFontPropo-Regular.otf")
@@ -48,46 +51,7 @@ def load_font_from_zip(zip_path: Path, font_name_in_zip: str) -> bool:
             if font_name_in_zip not in zip_ref.namelist():
                 print(f"Font file '{font_name_in_zip}' not found in zip: {zip_path}")
                 return False
-
-            # Extract font to a persistent cache directory
-            # Qt requires the font file to remain accessible for the lifetime of the application
-            import os
-
-            # Use platform-appropriate cache directory
-            if os.name == "nt":  # Windows
-                cache_base = Path(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")))
-            else:  # Unix-like (macOS, Linux)
-                cache_base = Path(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")))
-
-            cache_dir = cache_base / "check-cloud-drives" / "fonts"
-            cache_dir.mkdir(parents=True, exist_ok=True)
-
-            # Use a stable filename based on the font name
-            font_cache_path = cache_dir / font_name_in_zip
-
-            # Only extract if not already cached
-            if not font_cache_path.exists():
-                with open(font_cache_path, "wb") as f:
-                    f.write(zip_ref.read(font_name_in_zip))
-
-            # Store path to keep file alive for application lifetime
-            _extracted_font_files.append(font_cache_path)
-
-            # Load font into Qt's font database
-            font_id = QFontDatabase.addApplicationFont(str(font_cache_path))
-            if font_id == -1:
-                print(f"Failed to load font: {font_name_in_zip}")
-                return False
-
-            # Verify font was loaded by checking font families
-            font_families = QFontDatabase.applicationFontFamilies(font_id)
-            if font_families:
-                # Successfully loaded - don't print success message
-                return True
-            else:
-                print(f"Font loaded but no families found: {font_name_in_zip}")
-                return False
-
+            data = zip_ref.read(font_name_in_zip)
     except Exception as e:
         print(f"Error loading font from zip: {e}")
         import traceback
@@ -95,6 +59,8 @@ def load_font_from_zip(zip_path: Path, font_name_in_zip: str) -> bool:
         traceback.print_exc()
         return False
 
+    return _add_font_data(data, font_name_in_zip)
+
 
 def load_all_fonts_from_zip(zip_path: Path, font_pattern: str = "Propo") -> int:
     """
@@ -235,14 +201,31 @@ def setup_bundled_fonts(project_root: Path | None = None) -> bool:
     # Load the proportional font variant (used throughout the app)
     # The app uses "AtkynsonMono Nerd Font Propo" which corresponds to
     # "AtkynsonMonoNerdFontPropo-Regular.otf" in the zip
-    success = load_font_from_zip(font_zip, "AtkynsonMonoNerdFontPropo-Regular.otf")
-
-    # Optionally load other variants for better font rendering
-    if success:
-        # Load other Propo variants for different weights/styles
-        load_font_from_zip(font_zip, "AtkynsonMonoNerdFontPropo-Bold.otf")
-        load_font_from_zip(font_zip, "AtkynsonMonoNerdFontPropo-Italic.otf")
-        load_font_from_zip(font_zip, "AtkynsonMonoNerdFontPropo-BoldItalic.otf")
-        load_font_from_zip(font_zip, "AtkynsonMonoNerdFontPropo-Medium.otf")
+    regular = "AtkynsonMonoNerdFontPropo-Regular.otf"
+    # Other Propo variants for different weights/styles
+    variants = [
+        "AtkynsonMonoNerdFontPropo-Bold.otf",
+        "AtkynsonMonoNerdFontPropo-Italic.otf",
+        "AtkynsonMonoNerdFontPropo-BoldItalic.otf",
+        "AtkynsonMonoNerdFontPropo-Medium.otf",
+    ]
+
+    # Open the archive once for all variants
+    try:
+        with zipfile.ZipFile(font_zip, "r") as zip_ref:
+            names = set(zip_ref.namelist())
+            if regular not in names:
+                print(f"Font file '{regular}' not found in zip: {font_zip}")
+                return False
+            success = _add_font_data(zip_ref.read(regular), regular)
+
+            # Optionally load other variants for better font rendering
+            if success:
+                for variant in variants:
+                    if variant in names:
+                        _add_font_data(zip_ref.read(variant), variant)
+    except Exception as e:
+        print(f"Error loading fonts from zip: {e}")
+        return False
 
     return success
@@ -6,9 +6,10 @@ Author: Rich Lewis - @RichLewis007
 import sys
 from pathlib import Path
 
+from PySide6.QtGui import QFont
 from PySide6.QtWidgets import QApplication
 
-from .fonts import setup_bundled_fonts
+from .fonts import APP_FONT_FAMILY, setup_bundled_fonts
 from .ui.window import MainWindow
 
 
@@ -22,6 +23,12 @@ def main():
     project_root = Path(__file__).parent.parent.parent
     setup_bundled_fonts(project_root)
 
+    # Set the UI font once; widgets inherit it instead of resolving a
+    # font-family from their style sheets
+    app_font = QFont(APP_FONT_FAMILY)
+    app_font.setStyleHint(QFont.Monospace)
+    app.setFont(app_font)
+
     window = MainWindow()
     window.show()
 
@@ -3,10 +3,16 @@
 Author: Rich Lewis - @RichLewis007
 """
 
-from dataclasses import asdict, dataclass
+import sys
+from dataclasses import dataclass
 
+# Placeholder values for status fields that haven't been measured yet; interned so
+# every unmeasured field, here and in the rclone parser, shares one string object
+UNKNOWN = sys.intern("Unknown")
+NEVER = sys.intern("Never")
 
-@dataclass
+
+@dataclass(slots=True)
 class DriveConfig:
     """Configuration for a single cloud drive."""
 
@@ -16,29 +22,50 @@ class DriveConfig:
     enabled: bool = True
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # A plain dict literal; asdict() would deep-copy field by field for flat data
+        return {
+            "remote_name": self.remote_name,
+            "display_name": self.display_name,
+            "drive_type": self.drive_type,
+            "enabled": self.enabled,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "DriveConfig":
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class DriveStatus:
     """Status information for a cloud drive."""
 
     remote_name: str
-    total: str = "Unknown"
-    used: str = "Unknown"
-    free: str = "Unknown"
-    trash: str = "Unknown"
-    other: str = "Unknown"
-    objects: str = "Unknown"
-    last_updated: str = "Never"
+    total: str = UNKNOWN
+    used: str = UNKNOWN
+    free: str = UNKNOWN
+    trash: str = UNKNOWN
+    other: str = UNKNOWN
+    objects: str = UNKNOWN
+    last_updated: str = NEVER
     error: str | None = None
 
+    @classmethod
+    def unknown(cls, remote_name: str) -> "DriveStatus":
+        """Status for a drive that hasn't been checked yet."""
+        return cls(remote_name)
+
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "remote_name": self.remote_name,
+            "total": self.total,
+            "used": self.used,
+            "free": self.free,
+            "trash": self.trash,
+            "other": self.other,
+            "objects": self.objects,
+            "last_updated": self.last_updated,
+            "error": self.error,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "DriveStatus":
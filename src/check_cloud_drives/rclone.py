@@ -3,62 +3,129 @@
 Author: Rich Lewis - @RichLewis007
 """
 
+import re
 import subprocess
+import time
+from functools import lru_cache
 
 from PySide6.QtCore import QThread, Signal
 
+from .models import UNKNOWN, DriveStatus
+
+# Seconds `rclone about` may take before the refresh is reported as timed out
+ABOUT_TIMEOUT = 30.0
+
+# Fields reported by `rclone about`, in the order _parse_about_fields returns them
+_ABOUT_FIELDS = ("total", "used", "free", "trash", "other", "objects")
+# "<Field>: <value>" lines, any case; the value is everything after the first colon.
+# Matched on bytes so only the captured values ever get decoded.
+_ABOUT_LINE_RE = re.compile(
+    rb"^[ \t]*(total|used|free|trash|other|objects)[ \t]*:[ \t]*(.*?)[ \t\r]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+@lru_cache(maxsize=128)
+def _parse_about_fields(output: bytes) -> tuple[str, ...]:
+    """Extract the _ABOUT_FIELDS values from raw `rclone about` output.
+
+    Cached on the raw bytes: an unchanged drive reports identical output on
+    every refresh. Returns a tuple so cached results can't be mutated.
+    """
+    values = dict.fromkeys(_ABOUT_FIELDS, UNKNOWN)
+    # One regex scan over the whole output instead of a Python loop per line
+    for match in _ABOUT_LINE_RE.finditer(output):
+        values[match[1].decode("ascii").lower()] = match[2].decode("utf-8", "replace")
+    return tuple(values.values())
+
 
 class RcloneWorker(QThread):
     """Worker thread for executing rclone commands."""
 
-    finished = Signal(str, dict)  # remote_name, result dict
+    finished = Signal(str, object)  # remote_name, DriveStatus
     error = Signal(str, str)  # remote_name, error message
 
-    def __init__(self, command: list[str], remote_name: str = ""):
+    def __init__(
+        self, command: list[str], remote_name: str = "", timeout_seconds: float = ABOUT_TIMEOUT
+    ):
         super().__init__()
         self.command = command
         self.remote_name = remote_name
+        self.timeout_seconds = timeout_seconds
 
     def run(self):
         try:
-            result = subprocess.run(self.command, capture_output=True, text=True, timeout=30)
+            # Output stays as bytes; the parser decodes just the values it extracts
+            result = subprocess.run(self.command, capture_output=True, timeout=self.timeout_seconds)
             if result.returncode == 0:
-                output = result.stdout
-                parsed = self._parse_about_output(output)
-                self.finished.emit(self.remote_name, parsed)
+                parsed = self._parse_about_output(result.stdout)
+                self.finished.emit(self.remote_name, self._build_status(parsed))
             else:
-                self.error.emit(self.remote_name, result.stderr or "Unknown error")
+                stderr = result.stderr.decode("utf-8", "replace")
+                self.error.emit(self.remote_name, stderr or "Unknown error")
         except subprocess.TimeoutExpired:
             self.error.emit(self.remote_name, "Command timed out")
         except Exception as e:
             self.error.emit(self.remote_name, str(e))
 
-    def _parse_about_output(self, output: str) -> dict:
-        """Parse rclone about output into structured data."""
-        result = {
-            "total": "Unknown",
-            "used": "Unknown",
-            "free": "Unknown",
-            "trash": "Unknown",
-            "other": "Unknown",
-            "objects": "Unknown",
-            "raw": output,
-        }
-
-        lines = output.split("\n")
-        for line in lines:
-            line_lower = line.lower().strip()
-            if "total:" in line_lower:
-                result["total"] = line.split(":", 1)[1].strip() if ":" in line else "Unknown"
-            elif "used:" in line_lower:
-                result["used"] = line.split(":", 1)[1].strip() if ":" in line else "Unknown"
-            elif "free:" in line_lower:
-                result["free"] = line.split(":", 1)[1].strip() if ":" in line else "Unknown"
-            elif "trash:" in line_lower:
-                result["trash"] = line.split(":", 1)[1].strip() if ":" in line else "Unknown"
-            elif "other:" in line_lower:
-                result["other"] = line.split(":", 1)[1].strip() if ":" in line else "Unknown"
-            elif "objects:" in line_lower:
-                result["objects"] = line.split(":", 1)[1].strip() if ":" in line else "Unknown"
+    def _parse_about_output(self, output: bytes | str) -> dict:
+        """Parse rclone about output (raw bytes or text) into structured data.
 
+        "raw" is always text, whichever form the output came in.
+        """
+        if isinstance(output, str):
+            data, text = output.encode(), output
+        else:
+            data, text = output, output.decode("utf-8", "replace")
+        result = dict(zip(_ABOUT_FIELDS, _parse_about_fields(data), strict=True))
+        result["raw"] = text
         return result
+
+    def _build_status(self, parsed: dict) -> DriveStatus:
+        """Build the DriveStatus for parsed about output, stamped with the local time.
+
+        Done here so the GUI thread only has to display the result.
+        """
+        return DriveStatus(
+            remote_name=self.remote_name,
+            total=parsed["total"],
+            used=parsed["used"],
+            free=parsed["free"],
+            trash=parsed["trash"],
+            other=parsed["other"],
+            objects=parsed["objects"],
+            last_updated=time.strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
+
+class RemoteListWorker(QThread):
+    """Worker thread that lists configured rclone remotes."""
+
+    remotes_ready = Signal(list)  # remote names (without trailing colon)
+    rclone_missing = Signal()  # rclone could not be started or did not respond
+    error = Signal(str)  # error message
+
+    def run(self):
+        # A missing rclone surfaces as FileNotFoundError from listremotes itself,
+        # so no separate `rclone version` probe (and extra spawn) is needed
+        try:
+            result = subprocess.run(
+                ["rclone", "listremotes"], capture_output=True, text=True, timeout=10
+            )
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            self.rclone_missing.emit()
+            return
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+
+        if result.returncode == 0:
+            self.remotes_ready.emit(self._parse_listremotes_output(result.stdout))
+        else:
+            self.error.emit(result.stderr or "Unknown error")
+
+    def _parse_listremotes_output(self, output: str) -> list[str]:
+        """Parse rclone listremotes output into remote names."""
+        # rclone prints one "name:" per line; slicing off the colon is the only
+        # allocation per remote, and splitlines also handles \r\n
+        return [line[:-1] for line in output.splitlines() if line.endswith(":")]
@@ -0,0 +1,108 @@
+"""Run-at-startup support (macOS Launch Agent).
+
+Author: Rich Lewis - @RichLewis007
+"""
+
+import logging
+import plistlib
+import subprocess
+from pathlib import Path
+
+from PySide6.QtCore import QThread, Signal
+
+log = logging.getLogger(__name__)
+
+LAUNCH_AGENT_LABEL = "com.checkclouddrives"
+
+# launchctl normally returns well under a second; don't let a wedged call pin the worker
+LAUNCHCTL_TIMEOUT = 10
+
+
+def launch_agent_path() -> Path:
+    """Path of the app's Launch Agent plist."""
+    return Path.home() / "Library" / "LaunchAgents" / f"{LAUNCH_AGENT_LABEL}.plist"
+
+
+def _launchctl(action: str, plist_path: Path):
+    """Run `launchctl <action> <plist>`, discarding its output.
+
+    The app usually has no console, so launchctl's messages would go nowhere
+    useful; sending them to /dev/null also avoids inheriting the GUI's streams.
+    """
+    subprocess.run(
+        ["launchctl", action, str(plist_path)],
+        check=False,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        timeout=LAUNCHCTL_TIMEOUT,
+    )
+
+
+class LaunchAgentWorker(QThread):
+    """Worker thread that installs or removes the Launch Agent.
+
+    Writing the plist and calling launchctl can take hundreds of milliseconds,
+    so this runs off the GUI thread. Paths are resolved by the caller on the
+    GUI thread and passed in.
+    """
+
+    error = Signal(bool, str)  # enable, error message
+
+    def __init__(
+        self,
+        enable: bool,
+        plist_path: Path,
+        project_root: Path,
+        script_path: Path | None = None,
+        python_path: Path | None = None,
+    ):
+        super().__init__()
+        self.enable = enable
+        self.plist_path = plist_path
+        self.project_root = project_root
+        self.script_path = script_path  # run.sh, if present
+        self.python_path = python_path  # Fallback interpreter when there is no run.sh
+
+    def run(self):
+        try:
+            if self.enable:
+                self._install()
+            else:
+                self._remove()
+        except Exception as e:
+            log.exception("Error setting run at startup")
+            self.error.emit(self.enable, str(e))
+
+    def _install(self):
+        """Write the plist and load it with launchctl."""
+        self.plist_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.script_path is not None:
+            # Use bash to execute the run.sh script
+            program_arguments = ["/bin/bash", str(self.script_path)]
+        else:
+            # Fallback: use Python with module
+            program_arguments = [str(self.python_path), "-m", "check_cloud_drives.main"]
+
+        plist = {
+            "Label": LAUNCH_AGENT_LABEL,
+            "ProgramArguments": program_arguments,
+            "RunAtLoad": True,
+            "KeepAlive": False,
+            "WorkingDirectory": str(self.project_root),
+        }
+        # Binary plists are smaller, launchd reads them natively, and plistlib
+        # takes care of escaping paths containing spaces, & or <
+        data = plistlib.dumps(plist, fmt=plistlib.FMT_BINARY)
+        if self.plist_path.exists() and self.plist_path.read_bytes() == data:
+            return  # Already installed with identical content; nothing to reload
+        self.plist_path.write_bytes(data)
+
+        # Load the launch agent
+        _launchctl("load", self.plist_path)
+
+    def _remove(self):
+        """Unload and remove the plist."""
+        if self.plist_path.exists():
+            _launchctl("unload", self.plist_path)
+            self.plist_path.unlink()
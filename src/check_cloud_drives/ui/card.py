@@ -31,8 +31,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from ..models import DriveConfig, DriveStatus
-from .utils import load_icon
+from ..models import UNKNOWN, DriveConfig, DriveStatus
+from .utils import load_icon, standard_button_height
 
 
 def format_relative_time(timestamp_str: str) -> str:
@@ -178,6 +178,7 @@ class DriveCard(QFrame):
         self.last_updated_str: str | None = None  # Store last updated timestamp string
         # Timer to update relative time every minute
         self.time_update_timer = QTimer(self)
+        self.time_update_timer.setTimerType(Qt.VeryCoarseTimer)  # Second-level accuracy is plenty
         self.time_update_timer.timeout.connect(self._update_relative_time)
         self.time_update_timer.start(60000)  # Update every 60 seconds (1 minute)
         self._setup_ui()
@@ -202,7 +203,6 @@ class DriveCard(QFrame):
                 border-radius: 12px;
                 padding: 4px 6px;
                 margin: 4px;
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
             }
             QFrame:hover {
                 border-color: #4a90e2;
@@ -217,7 +217,6 @@ class DriveCard(QFrame):
                 border-radius: 4px;
                 padding: 4px;
                 color: #2c3e50;
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
             }
             QLineEdit:focus {
                 border-color: #4a90e2;
@@ -225,7 +224,6 @@ class DriveCard(QFrame):
             }
             QLabel {
                 color: #2c3e50;
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
             }
         """)
 
@@ -244,27 +242,14 @@ class DriveCard(QFrame):
         # Icon stays visible in both normal and edit mode
         icon_label = QLabel()
         icon_base_size = 52  # Base size for visibility without being too large
-        icon_pixmap, aspect_ratio = load_icon(self.drive_config.drive_type, size=icon_base_size)
+        icon_pixmap, _ = load_icon(self.drive_config.drive_type, size=icon_base_size)
 
-        # Calculate dimensions based on aspect ratio
-        # The load_icon function already returns a pixmap with correct aspect ratio
-        # We just need to match the label size to the pixmap size
+        # load_icon renders straight to the final size: the larger dimension is
+        # capped at icon_base_size, which keeps wide icons from widening the card,
+        # so the pixmap never needs a second scaling pass here
         icon_width = icon_pixmap.width()
         icon_height = icon_pixmap.height()
 
-        # Limit icon width to prevent cards from becoming too wide
-        # Maximum icon width should be reasonable (e.g., 70px for wide icons)
-        max_icon_width = 70
-        if icon_width > max_icon_width:
-            # Scale down proportionally
-            scale_factor = max_icon_width / icon_width
-            icon_width = max_icon_width
-            icon_height = int(icon_height * scale_factor)
-            # Scale the pixmap to match
-            icon_pixmap = icon_pixmap.scaled(
-                icon_width, icon_height, Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
-
         icon_label.setFixedSize(icon_width, icon_height)
         icon_label.setMinimumSize(icon_width, icon_height)
         icon_label.setAlignment(Qt.AlignCenter)
@@ -297,7 +282,6 @@ class DriveCard(QFrame):
         self.display_name_label = QLabel(self.drive_config.display_name)
         self.display_name_label.setStyleSheet("""
             QLabel {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
                 font-size: 16px;
                 font-weight: bold;
                 color: #2c3e50;
@@ -312,7 +296,6 @@ class DriveCard(QFrame):
         font = self.display_name_label.font()
         font.setPointSize(16)
         font.setBold(True)
-        font.setFamily("AtkynsonMono Nerd Font Propo")
         self.display_name_label.setFont(font)
         metrics = QFontMetrics(font)
         single_line_height = metrics.height()  # Actual line height
@@ -342,18 +325,20 @@ class DriveCard(QFrame):
         name_layout.addWidget(self.display_name_label, 1)  # Add stretch factor so it expands
 
         # Set initial display name (will be updated on resize if needed)
-        # Use a timer to update after layout is complete
-        QTimer.singleShot(100, lambda: self.update_display_name(self.drive_config.display_name))
+        # Use a timer to update after layout is complete; the card is the timers'
+        # context, so they are dropped if the card is deleted before they fire
+        QTimer.singleShot(
+            100, self, lambda: self.update_display_name(self.drive_config.display_name)
+        )
         # Force the label to update its geometry after being added to layout
         # This ensures word wrap has the correct width to work with
-        QTimer.singleShot(150, lambda: self._update_label_width())
+        QTimer.singleShot(150, self, self._update_label_width)
 
         # Remote name will be added at the bottom of the card later
         # Create it now but don't add to name_layout
         self.remote_name_label = QLabel(f"Remote: {self.drive_config.remote_name}")
         self.remote_name_label.setStyleSheet("""
             QLabel {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
                 font-size: 11px;
                 color: #7f8c8d;
                 background-color: transparent;
@@ -384,16 +369,12 @@ class DriveCard(QFrame):
 
         # Status information
         self.status_label = QLabel("Status: Not updated")
-        self.status_label.setStyleSheet(
-            "color: #7f8c8d; font-size: 13px; font-family: 'AtkynsonMono Nerd Font Propo', monospace;"
-        )
+        self.status_label.setStyleSheet("color: #7f8c8d; font-size: 13px;")
         layout.addWidget(self.status_label)
 
         # Drive info
         self.info_label = QLabel("Click 'Refresh All' to update")
-        self.info_label.setStyleSheet(
-            "color: #5a6c7d; font-size: 11px; font-family: 'AtkynsonMono Nerd Font Propo', monospace;"
-        )
+        self.info_label.setStyleSheet("color: #5a6c7d; font-size: 11px;")
         self.info_label.setWordWrap(True)
         layout.addWidget(self.info_label)
 
@@ -416,7 +397,6 @@ class DriveCard(QFrame):
         self.free_space_label = QLabel("")
         self.free_space_label.setStyleSheet("""
             QLabel {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
                 font-size: 16px;
                 font-weight: bold;
                 color: #e74c3c;
@@ -437,7 +417,6 @@ class DriveCard(QFrame):
             QPushButton {
                 color: #5a6c7d;
                 font-size: 24px;
-                font-family: 'AtkynsonMono Nerd Font Propo', monospace;
                 background-color: transparent;
                 border: none;
                 padding: 0px;
@@ -493,7 +472,6 @@ class DriveCard(QFrame):
         self.title_edit.setPlainText(self.drive_config.display_name)
         self.title_edit.setStyleSheet("""
             QTextEdit {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
                 font-size: 16px;
                 font-weight: bold;
                 color: #2c3e50;
@@ -512,7 +490,6 @@ class DriveCard(QFrame):
         font = self.title_edit.font()
         font.setPointSize(16)
         font.setBold(True)
-        font.setFamily("AtkynsonMono Nerd Font Propo")
         self.title_edit.setFont(font)
 
         # Remove document margins to get accurate line height
@@ -539,27 +516,14 @@ class DriveCard(QFrame):
         buttons_layout = QHBoxLayout()
         buttons_layout.addStretch()
 
-        # Create a reference button to get standard height (matching dialog buttons)
-        from PySide6.QtWidgets import QPushButton as RefButton
-
-        ref_button = RefButton("Cancel")
-        ref_button.setStyleSheet("""
-            QPushButton {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-                font-size: 12px;
-                font-weight: bold;
-                padding: 6px 12px;
-            }
-        """)
-        standard_button_height = ref_button.sizeHint().height()
-        ref_button.deleteLater()
+        # Match the standard dialog button height (measured once per process)
+        button_height = standard_button_height()
 
         # Cancel button (to the left of Save)
         cancel_button = QPushButton("Cancel")
-        cancel_button.setFixedHeight(standard_button_height)
+        cancel_button.setFixedHeight(button_height)
         cancel_button.setStyleSheet("""
             QPushButton {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
                 font-size: 12px;
                 font-weight: bold;
                 color: #2c3e50;
@@ -580,10 +544,9 @@ class DriveCard(QFrame):
 
         # Save button (green) - same height as Cancel
         save_button = QPushButton("Save")
-        save_button.setFixedHeight(standard_button_height)
+        save_button.setFixedHeight(button_height)
         save_button.setStyleSheet("""
             QPushButton {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
                 font-size: 12px;
                 font-weight: bold;
                 color: #ffffff;
@@ -611,10 +574,9 @@ class DriveCard(QFrame):
 
         remove_button = QPushButton("Remove Remote")
         # Match Save/Cancel button height, but allow width to fit text
-        remove_button.setFixedHeight(standard_button_height)
+        remove_button.setFixedHeight(button_height)
         remove_button.setStyleSheet("""
             QPushButton {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
                 font-size: 12px;
                 font-weight: bold;
                 color: #ffffff;
@@ -779,7 +741,11 @@ class DriveCard(QFrame):
                 if current_text:
                     # Re-set the text to force word wrap recalculation
                     self.display_name_label.setText("")  # Clear first
-                    QTimer.singleShot(10, lambda: self.display_name_label.setText(current_text))
+                    QTimer.singleShot(
+                        10,
+                        self.display_name_label,
+                        lambda: self.display_name_label.setText(current_text),
+                    )
 
     def update_display_name(self, name: str):
         """Update the display name label with truncation for 2 lines."""
@@ -877,9 +843,7 @@ class DriveCard(QFrame):
 
         if status.error:
             self.status_label.setText(f"Error: {status.error}")
-            self.status_label.setStyleSheet(
-                "color: #e74c3c; font-size: 13px; font-weight: bold; font-family: 'AtkynsonMono Nerd Font Propo', monospace;"
-            )
+            self.status_label.setStyleSheet("color: #e74c3c; font-size: 13px; font-weight: bold;")
             self.info_label.setText("Failed to retrieve drive information")
             self.last_updated_str = None
             self.free_space_label.hide()
@@ -887,14 +851,12 @@ class DriveCard(QFrame):
             # Store the timestamp string for relative time updates
             self.last_updated_str = status.last_updated
             self._update_relative_time()
-            self.status_label.setStyleSheet(
-                "color: #27ae60; font-size: 13px; font-weight: bold; font-family: 'AtkynsonMono Nerd Font Propo', monospace;"
-            )
+            self.status_label.setStyleSheet("color: #27ae60; font-size: 13px; font-weight: bold;")
 
             info_text = f"Total: {status.total}\n"
             info_text += f"Used: {status.used}\n"
             info_text += f"Free: {status.free}"
-            if status.objects != "Unknown":
+            if status.objects != UNKNOWN:
                 info_text += f"\nObjects: {status.objects}"
 
             self.info_label.setText(info_text)
@@ -902,7 +864,7 @@ class DriveCard(QFrame):
             # Extract and display free space value at bottom center
             # Extract just the number/value after "Free: " and format to one decimal place
             free_value = status.free
-            if free_value and free_value != "Unknown":
+            if free_value and free_value != UNKNOWN:
                 # Parse the value (e.g., "123.456 GB" -> "123.5 GB")
                 # Match number with optional decimals and unit
                 match = re.match(r"([\d.]+)\s*([A-Za-z]+)?", free_value)
@@ -939,9 +901,7 @@ class DriveCard(QFrame):
         self.is_updating = is_updating
         if is_updating:
             self.status_label.setText("Updating...")
-            self.status_label.setStyleSheet(
-                "color: #f39c12; font-size: 13px; font-weight: bold; font-family: 'AtkynsonMono Nerd Font Propo', monospace;"
-            )
+            self.status_label.setStyleSheet("color: #f39c12; font-size: 13px; font-weight: bold;")
             self.update_indicator.show()
             self.update_indicator.start()  # Start the spinner animation
             self.update_spacer.hide()  # Hide spacer to show indicator
@@ -1202,7 +1162,6 @@ class DriveCard(QFrame):
                 border-radius: 12px;
                     padding: 4px 6px;
                 margin: 4px;
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
             }
             """)
 
@@ -3,6 +3,8 @@
 Author: Rich Lewis - @RichLewis007
 """
 
+import functools
+import re
 import subprocess
 
 from PySide6.QtCore import Qt
@@ -20,6 +22,29 @@ from PySide6.QtWidgets import (
 )
 
 from ..models import DriveConfig
+from .utils import standard_button_height
+
+# Remote-name suffixes stripped when guessing a display name
+_SUFFIX_RE = re.compile(r"-(?:onedrive|gdrive|drive)|:")
+
+# (keyword, drive_type) pairs checked in order against the lowercased remote name
+_DRIVE_TYPE_KEYWORDS = (
+    ("gdrive", "googledrive"),
+    ("googledrive", "googledrive"),
+    ("onedrive", "onedrive"),
+    ("dropbox", "dropbox"),
+    ("protondrive", "protondrive"),
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _guess_drive_type_cached(remote_name: str) -> str:
+    """Guess drive type from remote name (memoized across dialog sessions)."""
+    remote_lower = remote_name.lower()
+    for keyword, drive_type in _DRIVE_TYPE_KEYWORDS:
+        if keyword in remote_lower:
+            return drive_type
+    return "unknown"
 
 
 class SetupDialog(QDialog):
@@ -48,33 +73,7 @@ class SetupDialog(QDialog):
 
     def _setup_ui(self):
         """Set up the setup dialog UI."""
-        # Apply font to dialog
-        from PySide6.QtGui import QFont
-
-        app_font = QFont("AtkynsonMono Nerd Font Propo", -1)
-        self.setFont(app_font)
-
-        self.setStyleSheet("""
-            QDialog {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-            }
-            QLabel {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-            }
-            QLineEdit {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-            }
-            QListWidget {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-            }
-            QListWidget::item {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-            }
-            QPushButton {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-            }
-        """)
-
+        # The app font (set once in main) is inherited, so no per-dialog font is needed
         layout = QVBoxLayout(self)
 
         # Instructions
@@ -89,34 +88,42 @@ class SetupDialog(QDialog):
         layout.addWidget(list_label)
 
         self.remotes_list = QListWidget()
-        app_font = QFont("AtkynsonMono Nerd Font Propo", 13)
+        # One font on the list instead of a QFont per item
+        list_font = self.remotes_list.font()
+        list_font.setPointSize(13)
+        self.remotes_list.setFont(list_font)
+
+        # All rows share one font and height, so let Qt skip per-item sizeHint calls
+        self.remotes_list.setUniformItemSizes(True)
 
         # Create a dict for quick lookup of existing drives
         existing_dict = {d.remote_name: d for d in self.existing_drives}
 
-        # First, add existing drives in their saved order
-        for remote_name in self.drive_order:
-            if remote_name in existing_dict:
-                item = QListWidgetItem(remote_name)
-                item.setFont(app_font)
-                item.setCheckState(Qt.Checked)  # Existing drives are checked
-                self.remotes_list.addItem(item)
-
-        # Then add any other existing drives not in the order
-        for drive in self.existing_drives:
-            if drive.remote_name not in self.drive_order:
-                item = QListWidgetItem(drive.remote_name)
-                item.setFont(app_font)
-                item.setCheckState(Qt.Checked)  # Existing drives are checked
-                self.remotes_list.addItem(item)
-
-        # Finally, add new remotes that aren't already added
-        for remote in self.available_remotes:
-            if remote not in self.existing_remotes:
-                item = QListWidgetItem(remote)
-                item.setFont(app_font)
-                item.setCheckState(Qt.Unchecked)  # New remotes start unchecked
-                self.remotes_list.addItem(item)
+        # Populate with updates disabled so the list relayouts once, not per item
+        self.remotes_list.setUpdatesEnabled(False)
+        try:
+            # First, add existing drives in their saved order
+            for remote_name in self.drive_order:
+                if remote_name in existing_dict:
+                    item = QListWidgetItem(remote_name)
+                    item.setCheckState(Qt.Checked)  # Existing drives are checked
+                    self.remotes_list.addItem(item)
+
+            # Then add any other existing drives not in the order
+            for drive in self.existing_drives:
+                if drive.remote_name not in self.drive_order:
+                    item = QListWidgetItem(drive.remote_name)
+                    item.setCheckState(Qt.Checked)  # Existing drives are checked
+                    self.remotes_list.addItem(item)
+
+            # Finally, add new remotes that aren't already added
+            for remote in self.available_remotes:
+                if remote not in self.existing_remotes:
+                    item = QListWidgetItem(remote)
+                    item.setCheckState(Qt.Unchecked)  # New remotes start unchecked
+                    self.remotes_list.addItem(item)
+        finally:
+            self.remotes_list.setUpdatesEnabled(True)
 
         layout.addWidget(self.remotes_list)
 
@@ -126,7 +133,6 @@ class SetupDialog(QDialog):
         # Standard button styling (font, size, padding) - define early for reuse
         standard_button_style = """
             QPushButton {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
                 font-size: 12px;
                 font-weight: bold;
                 border-radius: 4px;
@@ -134,11 +140,8 @@ class SetupDialog(QDialog):
             }
         """
 
-        # Create a reference button to get standard height
-        ref_button = QPushButton("Cancel")
-        ref_button.setStyleSheet(standard_button_style)
-        standard_button_height = ref_button.sizeHint().height()
-        ref_button.deleteLater()
+        # Standard button height, measured once per process
+        button_height = standard_button_height()
 
         # Manual entry
         manual_layout = QHBoxLayout()
@@ -147,7 +150,7 @@ class SetupDialog(QDialog):
         self.manual_remote.setPlaceholderText("Enter rclone remote name")
         manual_layout.addWidget(self.manual_remote)
         add_btn = QPushButton("Add")
-        add_btn.setFixedHeight(standard_button_height)
+        add_btn.setFixedHeight(button_height)
         add_btn.setStyleSheet(
             standard_button_style
             + """
@@ -198,7 +201,7 @@ class SetupDialog(QDialog):
 
         if ok_button:
             # Match Cancel button height and style OK button green
-            ok_button.setFixedHeight(standard_button_height)
+            ok_button.setFixedHeight(button_height)
             ok_button.setStyleSheet(
                 standard_button_style
                 + """
@@ -248,8 +251,6 @@ class SetupDialog(QDialog):
 
     def _add_manual(self):
         """Add manually entered remote."""
-        from PySide6.QtGui import QFont
-
         remote_name = self._normalize_remote_name(self.manual_remote.text())
         if remote_name:
             # Check if it already exists in the list (compare normalized names)
@@ -307,8 +308,6 @@ class SetupDialog(QDialog):
 
             # Validation passed - add new item with normalized name
             item = QListWidgetItem(remote_name)
-            app_font = QFont("AtkynsonMono Nerd Font Propo", 13)
-            item.setFont(app_font)
             item.setCheckState(Qt.Checked)
             self.remotes_list.addItem(item)
             self.manual_remote.clear()
@@ -351,21 +350,10 @@ class SetupDialog(QDialog):
     def _guess_display_name(self, remote_name: str) -> str:
         """Guess a display name from remote name."""
         # Remove common suffixes
-        name = remote_name.replace("-onedrive", "").replace("-gdrive", "")
-        name = name.replace("-drive", "").replace(":", "")
+        name = _SUFFIX_RE.sub("", remote_name)
         # Capitalize
         return name.replace("-", " ").title()
 
     def _guess_drive_type(self, remote_name: str) -> str:
         """Guess drive type from remote name."""
-        remote_lower = remote_name.lower()
-        if "gdrive" in remote_lower or "googledrive" in remote_lower:
-            return "googledrive"
-        elif "onedrive" in remote_lower:
-            return "onedrive"
-        elif "dropbox" in remote_lower:
-            return "dropbox"
-        elif "protondrive" in remote_lower:
-            return "protondrive"
-        else:
-            return "unknown"
+        return _guess_drive_type_cached(remote_name)
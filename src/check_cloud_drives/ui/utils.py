@@ -3,46 +3,122 @@
 Author: Rich Lewis - @RichLewis007
 """
 
+import functools
+import logging
 from pathlib import Path
 
-from PySide6.QtCore import QRect, Qt
-from PySide6.QtGui import QColor, QFont, QImage, QPainter, QPixmap
+from PySide6.QtCore import QByteArray, QRect, Qt
+from PySide6.QtGui import QColor, QFont, QPainter, QPixmap
 from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtWidgets import QPushButton
+
+log = logging.getLogger(__name__)
+
+# Rendered icons keyed by (drive_type, size). QPixmap is implicitly shared, so
+# handing the same cached pixmap to several cards is cheap and safe.
+_ICON_CACHE: dict[tuple[str, int], tuple[QPixmap, float]] = {}
+
+# Raw SVG file contents keyed by icon name (file stem), read once on first use
+_SVG_BYTES: dict[str, bytes] = {}
+_svgs_preloaded = False
+
+# Placeholder circle colors by drive type
+_DRIVE_COLORS = {
+    "googledrive": QColor(66, 133, 244),
+    "onedrive": QColor(0, 120, 212),
+    "dropbox": QColor(0, 126, 229),
+    "protondrive": QColor(255, 255, 255),
+}
+_DEFAULT_COLOR = QColor(100, 100, 100)
+_PLACEHOLDER_TEXT_COLOR = QColor(255, 255, 255)
+
+# Placeholder letter fonts keyed by point size
+_FONT_CACHE: dict[int, QFont] = {}
+
+# Styling of the reference button that defines the standard action button height
+_REFERENCE_BUTTON_STYLE = """
+    QPushButton {
+        font-size: 12px;
+        font-weight: bold;
+        padding: 6px 12px;
+    }
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def standard_button_height() -> int:
+    """Height of a standard "Cancel" button (12px bold, 6px 12px padding).
+
+    Dialog, settings and card action buttons are all sized to match it. It is
+    measured once per process from a throwaway button rather than per widget.
+    """
+    probe = QPushButton("Cancel")
+    probe.setStyleSheet(_REFERENCE_BUTTON_STYLE)
+    height = probe.sizeHint().height()
+    probe.deleteLater()
+    return height
 
 
+@functools.lru_cache(maxsize=1)
 def get_assets_dir() -> Path:
-    """Get the path to the assets directory."""
-    # Get the project root (3 levels up from this file: ui -> check_cloud_drives -> src -> project_root)
-    project_root = Path(__file__).parent.parent.parent.parent
+    """Get the path to the assets directory (computed once per process)."""
+    # Project root is 3 levels up from this file's directory: ui -> check_cloud_drives -> src -> project_root
+    project_root = Path(__file__).resolve().parents[3]
     return project_root / "assets"
 
 
+def _preload_svgs():
+    """Read every bundled SVG icon into memory so renders don't touch the filesystem."""
+    global _svgs_preloaded
+    if _svgs_preloaded:
+        return
+    _svgs_preloaded = True
+
+    icons_dir = get_assets_dir() / "icons"
+    for path in icons_dir.glob("*.svg"):
+        try:
+            _SVG_BYTES[path.stem] = path.read_bytes()
+        except OSError:
+            log.exception("Error reading SVG icon %s", path)
+
+
+def _get_font(size: int) -> QFont:
+    """Return the bold placeholder font at the given point size, creating it once."""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        # Built lazily: QFont needs a running QGuiApplication
+        font = QFont("Arial", size, QFont.Bold)
+        _FONT_CACHE[size] = font
+    return font
+
+
 def load_icon(drive_type: str, size: int = 56) -> tuple[QPixmap, float]:
-    """Load icon for drive type, with fallback to placeholder."""
+    """Load icon for drive type, with fallback to placeholder.
+
+    Results are cached per (drive_type, size), so repeated calls skip the SVG
+    parse and rasterization entirely.
+    """
+    cached = _ICON_CACHE.get((drive_type, size))
+    if cached is not None:
+        return cached
+
+    # Bundled icons are served from memory; only unknown types fall back to disk
+    _preload_svgs()
+    svg_data = _SVG_BYTES.get(drive_type)
+
     # Try to load SVG icon from assets directory
-    assets_dir = get_assets_dir()
-    icon_path = assets_dir / "icons" / f"{drive_type}.svg"
-
-    # Also check for common typos/variations
-    if not icon_path.exists():
-        if drive_type == "googledrive":
-            # Check for googledrive icon
-            alt_path = assets_dir / "icons" / "googledrive.svg"
-            if alt_path.exists():
-                icon_path = alt_path
-        elif drive_type == "onedrive":
-            # Ensure onedrive icon is used
-            alt_path = assets_dir / "icons" / "onedrive.svg"
-            if alt_path.exists():
-                icon_path = alt_path
-
-    if icon_path.exists():
+    icon_path = get_assets_dir() / "icons" / f"{drive_type}.svg"
+
+    if svg_data is not None or icon_path.exists():
         try:
             # Use QSvgRenderer directly for better control over viewBox rendering
             # QIcon can sometimes crop SVGs, so we'll use QSvgRenderer for more precise control
 
             # Use QSvgRenderer - render entire viewBox to full pixmap
-            renderer = QSvgRenderer(str(icon_path))
+            if svg_data is not None:
+                renderer = QSvgRenderer(QByteArray(svg_data))
+            else:
+                renderer = QSvgRenderer(str(icon_path))
             if renderer.isValid():
                 # Get viewBox - this defines the coordinate system of the SVG
                 view_box = renderer.viewBox()
@@ -61,33 +137,26 @@ def load_icon(drive_type: str, size: int = 56) -> tuple[QPixmap, float]:
                     icon_height = size
                     icon_width = int(size * aspect_ratio)
 
-                # Create pixmap with the calculated dimensions
-                image = QImage(icon_width, icon_height, QImage.Format_ARGB32)
-                image.fill(0x00000000)  # Transparent background
+                # Render straight into the pixmap; no intermediate QImage copy
+                final_pixmap = QPixmap(icon_width, icon_height)
+                final_pixmap.fill(Qt.transparent)
 
-                painter = QPainter(image)
-                painter.setRenderHint(QPainter.Antialiasing)
-                painter.setRenderHint(QPainter.SmoothPixmapTransform)
+                painter = QPainter(final_pixmap)
+                painter.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
 
-                # Render the SVG to the image maintaining aspect ratio
+                # Render the SVG to the pixmap maintaining aspect ratio
                 renderer.render(painter, QRect(0, 0, icon_width, icon_height))
                 painter.end()
 
-                # Convert to pixmap
-                final_pixmap = QPixmap.fromImage(image)
-
                 if not final_pixmap.isNull() and final_pixmap.width() > 0:
+                    _ICON_CACHE[(drive_type, size)] = (final_pixmap, aspect_ratio)
                     return final_pixmap, aspect_ratio
                 else:
-                    print(f"QSvgRenderer produced null/empty pixmap for: {icon_path}")
-        except Exception as e:
-            print(f"Error loading SVG icon from {icon_path}: {e}")
-            import traceback
-
-            traceback.print_exc()
-            pass
+                    log.debug("QSvgRenderer produced null/empty pixmap for: %s", icon_path)
+        except Exception:
+            log.exception("Error loading SVG icon from %s", icon_path)
     else:
-        print(f"SVG icon file not found: {icon_path} (drive_type: {drive_type})")
+        log.debug("SVG icon file not found: %s (drive_type: %s)", icon_path, drive_type)
 
     # Fallback: create placeholder icon (square)
     pixmap = QPixmap(size, size)
@@ -96,24 +165,17 @@ def load_icon(drive_type: str, size: int = 56) -> tuple[QPixmap, float]:
     painter.setRenderHint(QPainter.Antialiasing)
 
     # Draw colored circle based on drive type
-    colors = {
-        "googledrive": QColor(66, 133, 244),
-        "onedrive": QColor(0, 120, 212),
-        "dropbox": QColor(0, 126, 229),
-        "protondrive": QColor(255, 255, 255),
-    }
-    color = colors.get(drive_type, QColor(100, 100, 100))
-    painter.setBrush(color)
+    painter.setBrush(_DRIVE_COLORS.get(drive_type, _DEFAULT_COLOR))
     painter.setPen(Qt.NoPen)
     margin = 4
     painter.drawEllipse(margin, margin, size - 2 * margin, size - 2 * margin)
 
     # Draw emoji/letter (white text for contrast on colored background)
-    painter.setPen(QColor(255, 255, 255))
-    font_size = int(size * 0.5)
-    painter.setFont(QFont("Arial", font_size, QFont.Bold))
+    painter.setPen(_PLACEHOLDER_TEXT_COLOR)
+    painter.setFont(_get_font(int(size * 0.5)))
     letter = drive_type[0].upper() if drive_type != "unknown" else "?"
     painter.drawText(pixmap.rect(), Qt.AlignCenter, letter)
     painter.end()
 
-    return pixmap, 1.0  # Square aspect ratio for placeholder
+    _ICON_CACHE[(drive_type, size)] = (pixmap, 1.0)  # Square aspect ratio for placeholder
+    return pixmap, 1.0
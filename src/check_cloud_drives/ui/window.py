@@ -3,10 +3,13 @@
 Author: Rich Lewis - @RichLewis007
 """
 
+import functools
+import logging
 import platform
-import subprocess
 import sys
-from datetime import datetime
+import time
+from collections import deque
+from collections.abc import Callable
 from pathlib import Path
 
 from PySide6.QtCore import QPoint, QRect, Qt, QTimer
@@ -19,6 +22,7 @@ from PySide6.QtGui import (
     QIcon,
     QPainter,
     QPixmap,
+    QScreen,
 )
 from PySide6.QtWidgets import (
     QApplication,
@@ -33,32 +37,303 @@ from PySide6.QtWidgets import (
     QPushButton,
     QScrollArea,
     QSpinBox,
+    QStackedWidget,
     QSystemTrayIcon,
     QVBoxLayout,
     QWidget,
 )
 
 from ..config import ConfigManager
+from ..fonts import APP_FONT_FAMILY
 from ..models import DriveConfig, DriveStatus
-from ..rclone import RcloneWorker
+from ..rclone import RcloneWorker, RemoteListWorker
+from ..startup import LaunchAgentWorker, launch_agent_path
 from .card import DriveCard
 from .dialogs import SetupDialog
+from .utils import standard_button_height
+
+log = logging.getLogger(__name__)
+
+# Upper bound on simultaneous `rclone about` subprocesses during a refresh
+MAX_CONCURRENT_REFRESHES = 4
+
+# How long a successful `rclone listremotes` result is reused, in seconds
+REMOTES_CACHE_TTL = 30.0
+
+# Drive list/order writes within this window collapse into one, in milliseconds
+SAVE_DELAY_MS = 500
+
+# Project root (holds the config file and run.sh) and the running interpreter,
+# resolved once at import rather than on every settings save
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+_RUN_SCRIPT = _PROJECT_ROOT / "run.sh"
+_PYTHON = Path(sys.executable).resolve()
+
+# Style sheets, built once at import instead of per widget construction
+_TITLE_STYLE = """
+    font-size: 18px;
+    font-weight: bold;
+    color: #2c3e50;
+    padding: 8px;
+    background-color: #ecf0f1;
+    border-radius: 6px;
+"""
+
+_SCROLL_AREA_STYLE = """
+    QScrollArea {
+        border: none;
+        background-color: #f8f9fa;
+    }
+    QScrollBar:vertical {
+        background-color: #ecf0f1;
+        width: 12px;
+        border-radius: 6px;
+    }
+    QScrollBar::handle:vertical {
+        background-color: #bdc3c7;
+        border-radius: 6px;
+        min-height: 20px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background-color: #95a5a6;
+    }
+"""
+
+_MAIN_WINDOW_STYLE = """
+    QMainWindow {
+        background-color: #f8f9fa;
+    }
+    QPushButton {
+        background-color: #4a90e2;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #357abd;
+    }
+    QPushButton:pressed {
+        background-color: #2a6ba0;
+    }
+    QPushButton#refreshButton, QPushButton#addDriveButton, QPushButton#settingsButton {
+        min-width: 45px;
+        max-width: 45px;
+        min-height: 32px;
+        max-height: 32px;
+        padding: 4px;
+    }
+    QPushButton#refreshButton {
+        font-size: 26px;
+    }
+    QPushButton#settingsButton {
+        font-size: 22px;
+    }
+"""
+
+# Settings page: one sheet on the page widget, parsed once for all its children.
+# The bare QWidget rule comes first so later rules override it per property.
+_SETTINGS_PAGE_STYLE = """
+    QWidget {
+        background-color: #ffffff;
+        border: 2px solid #e0e0e0;
+        border-radius: 12px;
+        margin: 4px;
+    }
+    QLabel#settingsTitle {
+        font-size: 20px;
+        font-weight: bold;
+        color: #2c3e50;
+        padding: 8px 0px;
+    }
+    QGroupBox {
+        font-size: 14px;
+        font-weight: bold;
+        color: #2c3e50;
+        border: 2px solid #e0e0e0;
+        border-radius: 8px;
+        margin-top: 12px;
+        padding-top: 12px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QCheckBox {
+        font-size: 12px;
+        color: #2c3e50;
+    }
+    QLabel#intervalLabel {
+        font-size: 12px;
+        color: #2c3e50;
+    }
+    QSpinBox {
+        font-size: 12px;
+        padding: 4px;
+        border: 1px solid #d0d0d0;
+        border-radius: 4px;
+        background-color: #ffffff;
+        color: #2c3e50;
+    }
+    QSpinBox::up-button {
+        background-color: #ecf0f1;
+        border: 1px solid #d0d0d0;
+        border-top-right-radius: 4px;
+        width: 20px;
+        subcontrol-origin: border;
+        subcontrol-position: top right;
+    }
+    QSpinBox::up-button:hover {
+        background-color: #bdc3c7;
+    }
+    QSpinBox::up-button:pressed {
+        background-color: #95a5a6;
+    }
+    QSpinBox::down-button {
+        background-color: #ecf0f1;
+        border: 1px solid #d0d0d0;
+        border-bottom-right-radius: 4px;
+        width: 20px;
+        subcontrol-origin: border;
+        subcontrol-position: bottom right;
+    }
+    QSpinBox::down-button:hover {
+        background-color: #bdc3c7;
+    }
+    QSpinBox::down-button:pressed {
+        background-color: #95a5a6;
+    }
+    QSpinBox::up-arrow {
+        image: none;
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-bottom: 6px solid #2c3e50;
+        width: 0px;
+        height: 0px;
+        margin-left: 2px;
+        margin-right: 2px;
+    }
+    QSpinBox::up-arrow:hover {
+        border-bottom-color: #1a252f;
+    }
+    QSpinBox::down-arrow {
+        image: none;
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-top: 6px solid #2c3e50;
+        width: 0px;
+        height: 0px;
+        margin-left: 2px;
+        margin-right: 2px;
+    }
+    QSpinBox::down-arrow:hover {
+        border-top-color: #1a252f;
+    }
+    QLabel#configPathLabel {
+        font-size: 11px;
+        color: #7f8c8d;
+        background-color: transparent;
+        border: none;
+        padding: 8px 0px;
+    }
+"""
+
+# Solid-colored action buttons (Hide/Exit/Cancel/Save). Their height comes from
+# setFixedHeight(standard_button_height()), so the sheets themselves are static.
+_COLORED_BUTTON_STYLE = """
+    {selector} {{
+        font-size: 12px;
+        font-weight: bold;
+        background-color: {background};
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 6px 12px;
+    }}
+    {selector}:hover {{
+        background-color: {hover};
+    }}
+    {selector}:pressed {{
+        background-color: {pressed};
+    }}
+"""
+
+_HIDE_BUTTON_STYLE = _COLORED_BUTTON_STYLE.format(
+    selector="QPushButton", background="#3498db", hover="#2980b9", pressed="#21618c"
+)
+_EXIT_BUTTON_STYLE = _COLORED_BUTTON_STYLE.format(
+    selector="QPushButton", background="#e74c3c", hover="#c0392b", pressed="#a93226"
+)
+# The settings page's Cancel and Save buttons are styled from the page sheet
+_SETTINGS_PAGE_STYLE += _COLORED_BUTTON_STYLE.format(
+    selector="QPushButton#settingsCancelButton",
+    background="#95a5a6",
+    hover="#7f8c8d",
+    pressed="#6c7a7b",
+) + _COLORED_BUTTON_STYLE.format(
+    selector="QPushButton#settingsSaveButton",
+    background="#27ae60",
+    hover="#229954",
+    pressed="#1e8449",
+)
+
+
+@functools.cache
+def _shared_font(family: str, size: int) -> QFont:
+    """Return one shared QFont per (family, size).
+
+    Built lazily because QFont needs a QGuiApplication; QFont is implicitly
+    shared, so handing the same instance to every painter is safe.
+    """
+    return QFont(family, size)
+
+
+@functools.lru_cache(maxsize=4)
+def _tray_icon(dpr: float) -> QIcon:
+    """Paint the tray icon once per device pixel ratio."""
+    # Simple icon (placeholder - you can replace with actual icon)
+    pixmap = QPixmap(int(32 * dpr), int(32 * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(QColor(100, 150, 255))
+    painter = QPainter(pixmap)
+    painter.setPen(QColor(255, 255, 255))
+    painter.setFont(_shared_font("Arial", 20))
+    painter.drawText(QRect(0, 0, 32, 32), Qt.AlignCenter, "☁")
+    painter.end()
+    return QIcon(pixmap)
 
 
 class StackedIconButton(QPushButton):
     """Button with stacked icons - cloud icon with plus icon on top."""
 
-    def __init__(self, text="", parent=None):
-        super().__init__(text, parent)
-        # Nerd Font Unicode codepoints (Private Use Area)
-        # nf-md-cloud: U+F0C2, nf-fa-plus: U+F067
-        self.cloud_icon = "\uf0c2"  # nf-md-cloud
-        self.plus_icon = "\uf067"  # nf-fa-plus
+    # Nerd Font Unicode codepoints (Private Use Area)
+    # nf-md-cloud: U+F0C2, nf-fa-plus: U+F067
+    cloud_icon = "\uf0c2"  # nf-md-cloud
+    plus_icon = "\uf067"  # nf-fa-plus
+
+    # Pre-rasterized glyph overlays shared by every instance, keyed by
+    # (width, height, device pixel ratio); the composition itself never changes
+    _overlay_cache: dict[tuple[int, int, float], QPixmap] = {}
+
+    def _overlay_pixmap(self) -> QPixmap:
+        """Return the cached glyph overlay for the current size and DPR."""
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr)
+        pixmap = self._overlay_cache.get(key)
+        if pixmap is None:
+            pixmap = self._render_icons(dpr)
+            self._overlay_cache[key] = pixmap
+        return pixmap
+
+    def _render_icons(self, dpr: float) -> QPixmap:
+        """Render the stacked cloud/plus glyphs into a transparent pixmap."""
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
 
-    def paintEvent(self, event):
-        """Custom paint to draw stacked icons."""
-        super().paintEvent(event)
-        painter = QPainter(self)
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
 
         # Get button rect
@@ -67,18 +342,24 @@ class StackedIconButton(QPushButton):
         center_y = rect.center().y()
 
         # Draw cloud icon (larger, base, inverted/white)
-        font = QFont("AtkynsonMono Nerd Font Propo", 22)  # Larger size
-        painter.setFont(font)
+        painter.setFont(_shared_font(APP_FONT_FAMILY, 22))  # Larger size
         painter.setPen(QColor("#ffffff"))  # Inverted (white)
         painter.drawText(rect, Qt.AlignCenter, self.cloud_icon)
 
         # Draw plus icon (smaller, blue color matching button, on top)
-        font_small = QFont("AtkynsonMono Nerd Font Propo", 14)  # Larger size
-        painter.setFont(font_small)
+        painter.setFont(_shared_font(APP_FONT_FAMILY, 14))  # Smaller size
         painter.setPen(QColor("#4a90e2"))  # Blue color matching button background
         # Position plus icon centered on cloud, moved up a little
         plus_rect = QRect(center_x - 12, center_y - 10, 24, 24)  # Moved up by 2 pixels
         painter.drawText(plus_rect, Qt.AlignCenter, self.plus_icon)
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        """Custom paint to draw stacked icons."""
+        super().paintEvent(event)
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._overlay_pixmap())
 
 
 class DropTargetWidget(QWidget):
@@ -89,6 +370,19 @@ class DropTargetWidget(QWidget):
         self.reorder_callback = reorder_callback
         self.setAcceptDrops(True)
 
+    def _card_at(self, pos: QPoint) -> DriveCard | None:
+        """Return the card containing pos, if any.
+
+        childAt uses Qt's own widget lookup; the hit may be a label or button
+        inside a card, so walk up to the owning DriveCard.
+        """
+        widget = self.childAt(pos)
+        while widget is not None and widget is not self:
+            if isinstance(widget, DriveCard):
+                return widget
+            widget = widget.parentWidget()
+        return None  # Spacing between cards or the trailing stretch
+
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter event."""
         if event.mimeData().hasText():
@@ -103,11 +397,7 @@ class DropTargetWidget(QWidget):
         drop_pos = event.position().toPoint()
 
         # Find which card (if any) is under the drop position
-        target_card = None
-        for child in self.findChildren(DriveCard):
-            if child.geometry().contains(drop_pos):
-                target_card = child
-                break
+        target_card = self._card_at(drop_pos)
 
         if target_card and self.reorder_callback:
             target_remote = target_card.drive_config.remote_name
@@ -123,15 +413,35 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         # Config file in project root directory
-        project_root = Path(__file__).parent.parent.parent.parent
-        config_path = project_root / "check-cloud-drives.toml"
+        config_path = _PROJECT_ROOT / "check-cloud-drives.toml"
         self.config_manager = ConfigManager(config_path)
         self.drive_cards: dict[str, DriveCard] = {}
-        self.workers: list[RcloneWorker] = []
+        self._card_order: list[str] = []  # Remote names in display order
+        self.workers: set[RcloneWorker] = set()  # Running workers only
+        self._startup_workers: set[LaunchAgentWorker] = set()
+        self._remote_list_workers: set[RemoteListWorker] = set()
+        self._last_run_at_startup_state: bool | None = None  # Last state applied
+        self._pending_run_at_startup: bool | None = None  # Requested while a change runs
+        self._refresh_queue: deque[str] = deque()  # Remotes waiting for a free worker
+        self._inflight: set[str] = set()  # Remotes queued or being refreshed
+        self._remotes_cache: tuple[float, list[str]] | None = None  # (monotonic ts, remotes)
+        self._remotes_callbacks: list[Callable[[list[str]], None]] = []  # Awaiting a listing
         self.refresh_timer = QTimer()
+        # Status is minute-granular; let the OS batch wakeups instead of forcing ms precision
+        self.refresh_timer.setTimerType(Qt.VeryCoarseTimer)
         self.refresh_timer.timeout.connect(self.refresh_all_drives)
+        # Trailing-edge debounce for drive list/order writes (reorders, bulk edits)
+        self._drives_dirty = False  # Drive list changed since the last write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setTimerType(Qt.CoarseTimer)
+        self._save_timer.setInterval(SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._write_pending_saves)
         self.standard_button_height = None  # Will be set in _setup_ui
 
+        # Tray "Quit" exits without a closeEvent, so flush pending writes there too
+        QApplication.instance().aboutToQuit.connect(self._flush_pending_saves)
+
         self._setup_ui()
         self._setup_tray()
         self._load_drives()
@@ -158,21 +468,14 @@ class MainWindow(QMainWindow):
         # Central widget
         central = QWidget()
         self.setCentralWidget(central)
+        self._central = central  # Overlay sizing reads this on every resize
         layout = QVBoxLayout(central)
         layout.setSpacing(8)
         layout.setContentsMargins(12, 12, 12, 12)
 
         # Title (draggable area)
         title = QLabel("Cloud Drive Status")
-        title.setStyleSheet("""
-            font-family: "AtkynsonMono Nerd Font Propo", monospace;
-            font-size: 18px;
-            font-weight: bold;
-            color: #2c3e50;
-            padding: 8px;
-            background-color: #ecf0f1;
-            border-radius: 6px;
-        """)
+        title.setStyleSheet(_TITLE_STYLE)
         title.setAlignment(Qt.AlignCenter)
         title.mousePressEvent = lambda e: self._title_mouse_press(e)
         title.mouseMoveEvent = lambda e: self._title_mouse_move(e)
@@ -183,25 +486,7 @@ class MainWindow(QMainWindow):
         # Scroll area for drive cards
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: #f8f9fa;
-            }
-            QScrollBar:vertical {
-                background-color: #ecf0f1;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #bdc3c7;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #95a5a6;
-            }
-        """)
+        scroll.setStyleSheet(_SCROLL_AREA_STYLE)
 
         scroll_widget = DropTargetWidget(self, self.reorder_cards)
         scroll_layout = QVBoxLayout(scroll_widget)
@@ -213,36 +498,18 @@ class MainWindow(QMainWindow):
 
         scroll.setWidget(scroll_widget)
 
-        # Calculate standard button height first (needed for settings page buttons)
-        # Create a reference button to get standard height (matching dialog buttons)
-        # Use same styling as dialog buttons: padding 6px 12px, font-size 12px, font-weight bold
-        ref_button = QPushButton("Cancel")
-        ref_button.setStyleSheet("""
-            QPushButton {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-                font-size: 12px;
-                font-weight: bold;
-                border-radius: 4px;
-                padding: 6px 12px;
-            }
-        """)
-        self.standard_button_height = ref_button.sizeHint().height()
-        ref_button.deleteLater()
+        # Standard button height (matching dialog buttons), also used by the settings page
+        self.standard_button_height = standard_button_height()
 
-        # Settings page (initially hidden)
-        self.settings_page = self._create_settings_page()
-        self.settings_page.hide()
+        # Settings page is built on first use (see _show_settings)
+        self.settings_page: QWidget | None = None
 
         # Store reference to scroll area
         self.scroll_area = scroll
 
-        # Stack widgets to switch between cards and settings
-        self.content_stack = QWidget()
-        content_stack_layout = QVBoxLayout(self.content_stack)
-        content_stack_layout.setContentsMargins(0, 0, 0, 0)
-        content_stack_layout.setSpacing(0)
-        content_stack_layout.addWidget(scroll)
-        content_stack_layout.addWidget(self.settings_page)
+        # Switch between cards and settings; only the current page is laid out and painted
+        self.content_stack = QStackedWidget()
+        self.content_stack.addWidget(scroll)
 
         layout.addWidget(self.content_stack)
 
@@ -253,49 +520,20 @@ class MainWindow(QMainWindow):
         # nf-md-cloud_refresh: U+F052A (codepoint f052a from nerdfonts.com)
         # Using the actual character provided by user: 󰔪
         refresh_btn = QPushButton("󰔪")  # nf-md-cloud_refresh
-        refresh_btn.setStyleSheet("""
-            QPushButton {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-                font-size: 26px;
-                min-width: 45px;
-                max-width: 45px;
-                min-height: 32px;
-                max-height: 32px;
-                padding: 4px;
-            }
-        """)
+        refresh_btn.setObjectName("refreshButton")  # Styled by the window style sheet
         refresh_btn.setToolTip("Refresh All")
         refresh_btn.clicked.connect(self.refresh_all_drives)
         controls.addWidget(refresh_btn)
 
         # Add Drive button with stacked icons (cloud + plus)
         add_btn = StackedIconButton("")
-        add_btn.setStyleSheet("""
-            QPushButton {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-                min-width: 45px;
-                max-width: 45px;
-                min-height: 32px;
-                max-height: 32px;
-                padding: 4px;
-            }
-        """)
+        add_btn.setObjectName("addDriveButton")  # Styled by the window style sheet
         add_btn.setToolTip("Add Drive")
         add_btn.clicked.connect(self._add_drive)
         controls.addWidget(add_btn)
 
         settings_btn = QPushButton("\uf013")  # nf-fa-cog (gear icon) - same as cards
-        settings_btn.setStyleSheet("""
-            QPushButton {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-                font-size: 22px;
-                min-width: 45px;
-                max-width: 45px;
-                min-height: 32px;
-                max-height: 32px;
-                padding: 4px;
-            }
-        """)
+        settings_btn.setObjectName("settingsButton")  # Styled by the window style sheet
         settings_btn.setToolTip("Settings")
         settings_btn.clicked.connect(self._show_settings)
         controls.addWidget(settings_btn)
@@ -304,54 +542,14 @@ class MainWindow(QMainWindow):
 
         # Hide button (blue) - same font and height as dialog buttons
         hide_btn = QPushButton("Hide")
-        hide_btn.setStyleSheet(f"""
-            QPushButton {{
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-                font-size: 12px;
-                font-weight: bold;
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                min-height: {self.standard_button_height}px;
-                max-height: {self.standard_button_height}px;
-                height: {self.standard_button_height}px;
-            }}
-            QPushButton:hover {{
-                background-color: #2980b9;
-            }}
-            QPushButton:pressed {{
-                background-color: #21618c;
-            }}
-        """)
+        hide_btn.setStyleSheet(_HIDE_BUTTON_STYLE)
         hide_btn.setFixedHeight(self.standard_button_height)
         hide_btn.clicked.connect(self.hide)
         controls.addWidget(hide_btn, alignment=Qt.AlignVCenter)
 
         # Exit button (red) - same font and height as dialog buttons
         exit_btn = QPushButton("Exit")
-        exit_btn.setStyleSheet(f"""
-            QPushButton {{
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-                font-size: 12px;
-                font-weight: bold;
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                min-height: {self.standard_button_height}px;
-                max-height: {self.standard_button_height}px;
-                height: {self.standard_button_height}px;
-            }}
-            QPushButton:hover {{
-                background-color: #c0392b;
-            }}
-            QPushButton:pressed {{
-                background-color: #a93226;
-            }}
-        """)
+        exit_btn.setStyleSheet(_EXIT_BUTTON_STYLE)
         exit_btn.setFixedHeight(self.standard_button_height)
         exit_btn.clicked.connect(QApplication.quit)
         controls.addWidget(exit_btn, alignment=Qt.AlignVCenter)
@@ -366,45 +564,18 @@ class MainWindow(QMainWindow):
         self.overlay.setAttribute(Qt.WA_TransparentForMouseEvents, False)  # Block mouse events
         self.overlay.lower()  # Start below other widgets
 
-        # Apply light theme with AtkynsonMono Nerd Font Propo
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f8f9fa;
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-            }
-            QPushButton {
-                background-color: #4a90e2;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #357abd;
-            }
-            QPushButton:pressed {
-                background-color: #2a6ba0;
-            }
-            QLabel {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-            }
-            QLineEdit {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-            }
-            QListWidget {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-            }
-            QDialog {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-            }
-        """)
+        # Apply light theme (the font family comes from the application font)
+        self.setStyleSheet(_MAIN_WINDOW_STYLE)
 
         # Track mouse for edge snapping
         self.edge_snap_threshold = 20  # pixels
+        self._screen_edges: tuple[int, int, int, int] | None = None  # Cached in _snap_to_edge
+        self._screen_tracking = False  # screenChanged is connected on first show
+        self._tracked_screen: QScreen | None = None  # Screen whose geometryChanged is connected
         self.is_dragging = False
         self.drag_position = QPoint()
+        self._pending_move_pos: QPoint | None = None
+        self._move_scheduled = False
 
     def _setup_tray(self):
         """Set up system tray icon."""
@@ -416,16 +587,7 @@ class MainWindow(QMainWindow):
 
         self.tray_icon = QSystemTrayIcon(self)
 
-        # Create a simple icon (placeholder - you can replace with actual icon)
-        pixmap = QPixmap(32, 32)
-        pixmap.fill(QColor(100, 150, 255))
-        painter = QPainter(pixmap)
-        painter.setPen(QColor(255, 255, 255))
-        painter.setFont(QFont("Arial", 20))
-        painter.drawText(pixmap.rect(), Qt.AlignCenter, "☁")
-        painter.end()
-
-        self.tray_icon.setIcon(QIcon(pixmap))
+        self.tray_icon.setIcon(_tray_icon(self.devicePixelRatioF()))
         self.tray_icon.setToolTip("Check Cloud Drives")
 
         # Tray menu
@@ -468,11 +630,20 @@ class MainWindow(QMainWindow):
     def _toggle_stay_on_top(self, checked: bool):
         """Toggle stay on top window flag."""
         self.config_manager.set_stay_on_top(checked)
-        if checked:
-            self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)
-        else:
-            self.setWindowFlags(self.windowFlags() & ~Qt.WindowStaysOnTopHint)
-        self.show()
+        self._apply_stay_on_top(checked)
+
+    def _apply_stay_on_top(self, enabled: bool):
+        """Set the stay-on-top hint, skipping the native window rebuild if unchanged.
+
+        Changing window flags recreates the native window, which hides it, so a
+        visible window has to be shown again afterwards.
+        """
+        if bool(self.windowFlags() & Qt.WindowStaysOnTopHint) == enabled:
+            return
+        was_visible = self.isVisible()
+        self.setWindowFlag(Qt.WindowStaysOnTopHint, enabled)
+        if was_visible:
+            self.show()  # Required to apply window flag changes
 
     def _load_drives(self):
         """Load drives from config and set up UI in saved order."""
@@ -497,81 +668,117 @@ class MainWindow(QMainWindow):
                 ordered_drives.append(drive_config)
 
             # Add cards in order
-            for drive_config in ordered_drives:
-                self._add_drive_card(drive_config)
+            self._add_drive_cards(ordered_drives)
 
-            # Auto-refresh on load
-            QTimer.singleShot(1000, self.refresh_all_drives)
+            # Auto-refresh on load, one event-loop tick after the window shows
+            # (nothing to do if every configured drive is disabled)
+            if self.drive_cards:
+                QTimer.singleShot(0, self.refresh_all_drives)
 
     def _first_run_setup(self):
         """Handle first run setup."""
-        available_remotes = self._get_available_remotes()
+        # The user may have only just configured rclone, so always ask it directly
+        self._show_overlay()
+        self._request_remotes(self._open_first_run_dialog, force_refresh=True)
+
+    def _open_first_run_dialog(self, available_remotes: list[str]):
+        """Show the first-run setup dialog once the remote list is available."""
         if available_remotes:
             drive_order = []  # Empty for first run
-            self._show_overlay()
             dialog = SetupDialog(available_remotes, [], drive_order, self)
             result = dialog.exec()
             self._hide_overlay()
             if result == QDialog.Accepted:
-                for drive_config in dialog.selected_drives:
-                    self._add_drive_card(drive_config)
+                self._add_drive_cards(dialog.selected_drives)
                 self._save_drives()
-                QTimer.singleShot(1000, self.refresh_all_drives)
+                if self.drive_cards:
+                    QTimer.singleShot(0, self.refresh_all_drives)
         else:
+            self._hide_overlay()
             QMessageBox.information(
                 self, "No Remotes Found", "No rclone remotes found. Please configure rclone first."
             )
 
-    def _get_available_remotes(self) -> list[str]:
-        """Get list of available rclone remotes."""
-        try:
-            # Check if rclone is available
-            subprocess.run(["rclone", "version"], capture_output=True, timeout=5)
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            QMessageBox.critical(
-                self,
-                "rclone Not Found",
-                "rclone is not installed or not in PATH.\n\n"
-                "Please install rclone from https://rclone.org/install/",
-            )
-            return []
-        except Exception:
-            pass  # Continue anyway
+    def _request_remotes(self, callback: Callable[[list[str]], None], force_refresh: bool = False):
+        """Get the list of available rclone remotes and pass it to callback.
 
-        try:
-            result = subprocess.run(
-                ["rclone", "listremotes"], capture_output=True, text=True, timeout=10
-            )
-            if result.returncode == 0:
-                remotes = [
-                    line.strip().rstrip(":")
-                    for line in result.stdout.strip().split("\n")
-                    if line.strip()
-                ]
-                return remotes
-        except Exception as e:
-            print(f"Error getting remotes: {e}")
-        return []
+        Successful results are cached for REMOTES_CACHE_TTL seconds and handed
+        over immediately; otherwise `rclone listremotes` runs on a
+        RemoteListWorker and callback is invoked from its signal, so the GUI
+        thread never blocks on rclone. Pass force_refresh=True to bypass the cache.
+        Requests made while a listing is already running join it instead of
+        spawning another rclone process.
+        """
+        if force_refresh:
+            self._remotes_cache = None
+        elif self._remotes_cache is not None:
+            cached_at, remotes = self._remotes_cache
+            if time.monotonic() - cached_at < REMOTES_CACHE_TTL:
+                callback(list(remotes))
+                return
+
+        self._remotes_callbacks.append(callback)
+        if len(self._remotes_callbacks) > 1:
+            return  # A listing is already in flight and will answer this caller too
+
+        worker = RemoteListWorker()
+        worker.remotes_ready.connect(self._on_remotes_ready)
+        worker.rclone_missing.connect(self._on_rclone_missing)
+        worker.error.connect(self._on_remotes_error)
+        worker.finished.connect(lambda: self._cleanup_remote_list_worker(worker))
+        worker.start()
+        self._remote_list_workers.add(worker)
+
+    def _deliver_remotes(self, remotes: list[str]):
+        """Hand a remote listing to every caller waiting on it."""
+        callbacks, self._remotes_callbacks = self._remotes_callbacks, []
+        for callback in callbacks:
+            callback(list(remotes))
+
+    def _on_remotes_ready(self, remotes: list[str]):
+        """Cache a successful remote listing and hand it to the waiting callers."""
+        self._remotes_cache = (time.monotonic(), remotes)
+        self._deliver_remotes(remotes)
+
+    def _on_rclone_missing(self):
+        """Tell the user rclone is unavailable; waiting callers get an empty list."""
+        QMessageBox.critical(
+            self,
+            "rclone Not Found",
+            "rclone is not installed or not in PATH.\n\n"
+            "Please install rclone from https://rclone.org/install/",
+        )
+        self._deliver_remotes([])
+
+    def _on_remotes_error(self, error: str):
+        """Log a failed remote listing (not cached); waiting callers get an empty list."""
+        log.error("Error getting remotes: %s", error)
+        self._deliver_remotes([])
+
+    def _cleanup_remote_list_worker(self, worker: RemoteListWorker):
+        """Release a finished remote listing worker."""
+        self._remote_list_workers.discard(worker)
+        worker.deleteLater()
 
     def _get_current_drive_order(self) -> list[str]:
-        """Get the current order of drive cards from the UI layout."""
-        order = []
-        # The stretch is at the end, so iterate all items except the last one
-        for i in range(self.cards_layout.count() - 1):  # Exclude stretch at end
-            item = self.cards_layout.itemAt(i)
-            if item and item.widget():
-                card = item.widget()
-                if isinstance(card, DriveCard):
-                    order.append(card.drive_config.remote_name)
-        return order
+        """Get the current order of drive cards as shown in the UI.
+
+        self._card_order is kept in step with the layout by every add, remove
+        and reorder, so no layout walk is needed.
+        """
+        return list(self._card_order)
 
     def _add_drive(self):
         """Add a new drive."""
-        available_remotes = self._get_available_remotes()
+        # The overlay dims the window and blocks clicks while remotes load
+        self._show_overlay()
+        self._request_remotes(self._open_add_drive_dialog)
+
+    def _open_add_drive_dialog(self, available_remotes: list[str]):
+        """Show the Add Drive dialog once the remote list is available."""
         existing_drives = self.config_manager.get_drives()
-        # Get current order from UI layout, not from config (to reflect any recent reordering)
+        # Get current order from the UI, not from config (to reflect any recent reordering)
         drive_order = self._get_current_drive_order()
-        self._show_overlay()
         dialog = SetupDialog(available_remotes, existing_drives, drive_order, self)
         result = dialog.exec()
         self._hide_overlay()
@@ -580,40 +787,60 @@ class MainWindow(QMainWindow):
             selected_remote_names = {d.remote_name for d in dialog.selected_drives}
             existing_remote_names = set(self.drive_cards.keys())
 
-            # Remove drives that are not in the selected list (unchecked)
-            for remote_name in list(self.drive_cards.keys()):
-                if remote_name not in selected_remote_names:
-                    card = self.drive_cards[remote_name]
-                    # Remove from layout
-                    self.cards_layout.removeWidget(card)
-                    card.deleteLater()
-                    # Remove from dict
-                    del self.drive_cards[remote_name]
-
-            # Separate existing drives from new drives
-            existing_drives = []
-            new_drives = []
-
-            for drive_config in dialog.selected_drives:
-                if drive_config.remote_name in existing_remote_names:
-                    existing_drives.append(drive_config)
-                else:
-                    new_drives.append(drive_config)
-
-            # Update existing cards (they stay in their current positions)
-            for drive_config in existing_drives:
-                if drive_config.remote_name in self.drive_cards:
-                    # Update card config if needed
-                    self.drive_cards[drive_config.remote_name].drive_config = drive_config
-
-            # Add new drives at the bottom (before the stretch)
-            for drive_config in new_drives:
-                self._add_drive_card(drive_config)
+            # Apply all removals and additions with one relayout/repaint
+            self.cards_container.setUpdatesEnabled(False)
+            try:
+                # Remove drives that are not in the selected list (unchecked)
+                for remote_name in list(self.drive_cards.keys()):
+                    if remote_name not in selected_remote_names:
+                        card = self.drive_cards[remote_name]
+                        # Remove from layout
+                        self.cards_layout.removeWidget(card)
+                        card.deleteLater()
+                        # Remove from dict
+                        del self.drive_cards[remote_name]
+                        self._card_order.remove(remote_name)
+
+                # Separate existing drives from new drives
+                existing_drives = []
+                new_drives = []
+
+                for drive_config in dialog.selected_drives:
+                    if drive_config.remote_name in existing_remote_names:
+                        existing_drives.append(drive_config)
+                    else:
+                        new_drives.append(drive_config)
+
+                # Update existing cards (they stay in their current positions)
+                for drive_config in existing_drives:
+                    if drive_config.remote_name in self.drive_cards:
+                        # Update card config if needed
+                        self.drive_cards[drive_config.remote_name].drive_config = drive_config
+
+                # Add new drives at the bottom (before the stretch)
+                for drive_config in new_drives:
+                    self._add_drive_card(drive_config)
+            finally:
+                self.cards_layout.activate()
+                self.cards_container.setUpdatesEnabled(True)
 
             # Save the updated drive list (only selected drives) and order
             self.config_manager.set_drives(dialog.selected_drives)
             self._save_drive_order()
-            self.refresh_all_drives()
+            # Status depends only on the remote, so cards that were already shown
+            # keep theirs; only the newly added drives need an rclone call
+            for drive_config in new_drives:
+                self._refresh_drive(self.drive_cards[drive_config.remote_name])
+
+    def _add_drive_cards(self, drive_configs: list[DriveConfig]):
+        """Add several drive cards with a single relayout and repaint."""
+        self.cards_container.setUpdatesEnabled(False)
+        try:
+            for drive_config in drive_configs:
+                self._add_drive_card(drive_config)
+        finally:
+            self.cards_layout.activate()
+            self.cards_container.setUpdatesEnabled(True)
 
     def _add_drive_card(self, drive_config: DriveConfig):
         """Add a drive card to the UI."""
@@ -629,6 +856,7 @@ class MainWindow(QMainWindow):
         # Connect signal to remove card
         card.card_removed.connect(lambda remote=drive_config.remote_name: self._remove_card(remote))
         self.drive_cards[drive_config.remote_name] = card
+        self._card_order.append(drive_config.remote_name)
 
         # Insert before stretch
         count = self.cards_layout.count()
@@ -643,7 +871,6 @@ class MainWindow(QMainWindow):
                 drive.display_name = display_name
                 break
         self.config_manager.set_drives(drives)
-        self.config_manager.save_config()
 
     def _remove_card(self, remote_name: str):
         """Remove a card from the UI and config."""
@@ -658,28 +885,46 @@ class MainWindow(QMainWindow):
 
         # Remove from dict
         del self.drive_cards[remote_name]
+        self._card_order.remove(remote_name)
 
-        # Update config - remove the drive from the list
-        drives = self.config_manager.get_drives()
-        drives = [d for d in drives if d.remote_name != remote_name]
-        self.config_manager.set_drives(drives)
-        self.config_manager.save_config()
-
-        # Update drive order
-        self._save_drive_order()
+        # Update config - remaining drives and their order
+        self._save_drives()
 
     def _save_drives(self):
-        """Save current drives to config."""
-        drives = []
-        for card in self.drive_cards.values():
-            drives.append(card.drive_config)
-        self.config_manager.set_drives(drives)
-        self._save_drive_order()
+        """Schedule a save of the current drives and their order.
+
+        Calls within SAVE_DELAY_MS collapse into a single trailing write.
+        """
+        self._drives_dirty = True
+        self._save_timer.start()
 
     def _save_drive_order(self):
-        """Save the current order of drive cards."""
-        order = self._get_current_drive_order()
-        self.config_manager.set_drive_order(order)
+        """Schedule a save of the current order of drive cards.
+
+        Calls within SAVE_DELAY_MS collapse into a single trailing write.
+        """
+        self._save_timer.start()
+
+    def _flush_pending_saves(self):
+        """Write pending drive changes now, cancelling any debounced save."""
+        self._save_timer.stop()
+        self._write_pending_saves()
+
+    def _write_pending_saves(self):
+        """Persist the current drives (if changed) and the order of drive cards."""
+        with self.config_manager.batch():
+            if self._drives_dirty:
+                self._drives_dirty = False
+                drives = [card.drive_config for card in self.drive_cards.values()]
+                # Cards exist only for enabled drives; keep the disabled ones
+                drives.extend(
+                    d
+                    for d in self.config_manager.get_drives()
+                    if not d.enabled and d.remote_name not in self.drive_cards
+                )
+                self.config_manager.set_drives(drives)
+            order = self._get_current_drive_order()
+            self.config_manager.set_drive_order(order)
 
     def reorder_cards(self, dragged_remote: str, target_remote: str):
         """Reorder cards when one is dragged onto another.
@@ -696,68 +941,101 @@ class MainWindow(QMainWindow):
         if dragged_remote not in self.drive_cards or target_remote not in self.drive_cards:
             return
 
-        dragged_card = self.drive_cards[dragged_remote]
-        target_card = self.drive_cards[target_remote]
-
-        # Get current positions in the layout
-        dragged_index = self.cards_layout.indexOf(dragged_card)
-        target_index = self.cards_layout.indexOf(target_card)
-
-        if dragged_index == -1 or target_index == -1:
-            return
-
-        # Get all cards in current order (excluding stretch)
-        current_cards = []
-        for i in range(self.cards_layout.count() - 1):  # Exclude stretch at end
-            item = self.cards_layout.itemAt(i)
-            if item and item.widget():
-                card = item.widget()
-                if isinstance(card, DriveCard):
-                    current_cards.append(card)
+        # Simple swap in the order list - no layout traversal needed
+        dragged_index = self._card_order.index(dragged_remote)
+        target_index = self._card_order.index(target_remote)
+        self._card_order[dragged_index] = target_remote
+        self._card_order[target_index] = dragged_remote
 
-        # Simple swap: create new order list by swapping the two cards
-        new_order = current_cards.copy()
-        new_order[dragged_index] = target_card
-        new_order[target_index] = dragged_card
-
-        # Remove all cards from layout (keep the stretch)
-        for card in current_cards:
-            self.cards_layout.removeWidget(card)
-
-        # Reinsert cards in new order (before the stretch)
-        for card in new_order:
-            self.cards_layout.insertWidget(self.cards_layout.count() - 1, card)
-
-        # Force layout update to ensure visual change
-        self.cards_layout.update()
+        self._swap_card_widgets(dragged_index, target_index)
 
         # Save new order
         self._save_drive_order()
 
+    def _swap_card_widgets(self, index_a: int, index_b: int):
+        """Move the two swapped cards to their new layout slots.
+
+        Layout positions mirror self._card_order (which is already swapped), so
+        only these two widgets move; the other cards are left untouched.
+        """
+        low, high = sorted((index_a, index_b))
+        low_card = self.drive_cards[self._card_order[low]]
+        high_card = self.drive_cards[self._card_order[high]]
+        container = self.cards_container
+        container.setUpdatesEnabled(False)
+        try:
+            self.cards_layout.removeWidget(low_card)
+            self.cards_layout.removeWidget(high_card)
+            # Insert the lower slot first so the higher index is still valid
+            self.cards_layout.insertWidget(low, low_card)
+            self.cards_layout.insertWidget(high, high_card)
+        finally:
+            container.setUpdatesEnabled(True)
+
     def refresh_all_drives(self):
         """Refresh status for all drives."""
+        if not self.drive_cards:
+            return
         for card in self.drive_cards.values():
             self._refresh_drive(card)
 
     def _refresh_drive(self, card: DriveCard):
-        """Refresh status for a single drive."""
+        """Refresh status for a single drive.
+
+        At most MAX_CONCURRENT_REFRESHES rclone processes run at once; further
+        requests are queued and started as earlier workers finish. A remote
+        that is already queued or running is not refreshed twice, so a slow
+        `rclone about` can't pile up overlapping runs across timer ticks.
+        """
         remote_name = card.drive_config.remote_name
-        if not remote_name:
+        if not remote_name or remote_name in self._inflight:
             return
 
         card.set_updating(True)
+        self._inflight.add(remote_name)
+
+        if len(self.workers) >= MAX_CONCURRENT_REFRESHES:
+            self._refresh_queue.append(remote_name)
+            return
 
+        self._start_refresh_worker(remote_name)
+
+    def _start_refresh_worker(self, remote_name: str):
+        """Start an rclone about worker for a remote."""
         worker = RcloneWorker(["rclone", "about", remote_name + ":"], remote_name)
-        worker.finished.connect(lambda rn, result: self._on_drive_update(rn, result, None))
+        worker.finished.connect(lambda rn, status: self._on_drive_update(rn, status, None))
         worker.error.connect(lambda rn, error: self._on_drive_update(rn, None, error))
         # Clean up worker when it finishes (lambda ignores signal arguments)
-        worker.finished.connect(lambda rn, result: self._cleanup_worker(worker))
+        worker.finished.connect(lambda rn, status: self._cleanup_worker(worker))
         worker.error.connect(lambda rn, error: self._cleanup_worker(worker))
         worker.start()
-        self.workers.append(worker)
-
-    def _on_drive_update(self, remote_name: str, result: dict | None, error: str | None):
-        """Handle drive update result."""
+        self.workers.add(worker)
+
+    def _start_queued_refreshes(self):
+        """Start queued refreshes while there is spare worker capacity."""
+        while self._refresh_queue and len(self.workers) < MAX_CONCURRENT_REFRESHES:
+            remote_name = self._refresh_queue.popleft()
+            # The card may have been removed while waiting in the queue
+            if remote_name in self.drive_cards:
+                self._start_refresh_worker(remote_name)
+            else:
+                self._inflight.discard(remote_name)
+
+    def _drop_queued_refreshes(self):
+        """Forget queued refreshes, taking their cards out of the updating state."""
+        while self._refresh_queue:
+            remote_name = self._refresh_queue.popleft()
+            self._inflight.discard(remote_name)
+            self._reset_updating(remote_name)
+
+    def _reset_updating(self, remote_name: str):
+        """Clear the "Updating..." state of a card whose refresh won't complete."""
+        card = self.drive_cards.get(remote_name)
+        if card is not None:
+            card.set_updating(False)
+
+    def _on_drive_update(self, remote_name: str, status: DriveStatus | None, error: str | None):
+        """Handle drive update result (a DriveStatus built by the worker, or an error)."""
         if remote_name not in self.drive_cards:
             return
 
@@ -766,29 +1044,27 @@ class MainWindow(QMainWindow):
 
         if error:
             status = DriveStatus(remote_name=remote_name, error=error)
-        else:
-            status = DriveStatus(
-                remote_name=remote_name,
-                total=result.get("total", "Unknown"),
-                used=result.get("used", "Unknown"),
-                free=result.get("free", "Unknown"),
-                trash=result.get("trash", "Unknown"),
-                other=result.get("other", "Unknown"),
-                objects=result.get("objects", "Unknown"),
-                last_updated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            )
 
+        # Status is transient and not persisted; drive configs are saved by
+        # the add/remove/reorder paths, so there is nothing to write here
         card.update_status(status)
-        self._save_drives()
 
     def _cleanup_worker(self, worker: RcloneWorker):
-        """Remove worker from the list when it finishes."""
-        if worker in self.workers:
-            self.workers.remove(worker)
+        """Remove worker from the running set when it finishes."""
+        self.workers.discard(worker)
+        self._inflight.discard(worker.remote_name)
         worker.deleteLater()
+        self._start_queued_refreshes()
 
     def _stop_all_workers(self):
         """Stop all running workers and wait for them to finish."""
+        self._drop_queued_refreshes()
+        # Let an in-progress Launch Agent change finish rather than cutting it off
+        for worker in list(self._startup_workers):
+            worker.wait(2000)
+        for worker in list(self._remote_list_workers):
+            worker.wait(2000)
+
         if not self.workers:
             return
 
@@ -798,157 +1074,57 @@ class MainWindow(QMainWindow):
         wait_timeout_ms = 2000  # Wait up to 2 seconds for normal completion
         terminate_timeout_ms = 1000  # Wait 1 second after terminate
 
-        for worker in self.workers[:]:  # Copy list to avoid modification during iteration
+        for worker in list(self.workers):  # Copy set to avoid modification during iteration
             if worker.isRunning():
                 # Wait briefly for the worker to finish normally
                 worker.wait(wait_timeout_ms)
 
-                # If still running, terminate it
+                # If still running, terminate it; it will never report back
                 if worker.isRunning():
                     worker.terminate()
                     worker.wait(terminate_timeout_ms)
+                    self._reset_updating(worker.remote_name)
 
         # Clean up all workers
-        for worker in self.workers[:]:
+        for worker in list(self.workers):
             if worker.isRunning():
                 worker.terminate()
                 worker.wait(terminate_timeout_ms)
+            # Let the next refresh (after the window is shown again) run this remote
+            self._inflight.discard(worker.remote_name)
             worker.deleteLater()
         self.workers.clear()
 
     def _create_settings_page(self) -> QWidget:
         """Create the settings page widget."""
         settings_widget = QWidget()
-        settings_widget.setStyleSheet("""
-            QWidget {
-                background-color: #ffffff;
-                border: 2px solid #e0e0e0;
-                border-radius: 12px;
-                margin: 4px;
-            }
-        """)
+        # Every widget on the page is styled by this one sheet
+        settings_widget.setStyleSheet(_SETTINGS_PAGE_STYLE)
         settings_layout = QVBoxLayout(settings_widget)
         settings_layout.setSpacing(12)
         settings_layout.setContentsMargins(20, 20, 20, 12)
 
         # Title
         title = QLabel("App Settings")
-        title.setStyleSheet("""
-            font-family: "AtkynsonMono Nerd Font Propo", monospace;
-            font-size: 20px;
-            font-weight: bold;
-            color: #2c3e50;
-            padding: 8px 0px;
-        """)
+        title.setObjectName("settingsTitle")
         settings_layout.addWidget(title)
 
         # Auto-refresh settings
         refresh_group = QGroupBox("Auto-Refresh")
-        refresh_group.setStyleSheet("""
-            QGroupBox {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-                font-size: 14px;
-                font-weight: bold;
-                color: #2c3e50;
-                border: 2px solid #e0e0e0;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
         refresh_layout = QVBoxLayout(refresh_group)
 
         self.auto_refresh_enabled = QCheckBox("Enable auto-refresh")
-        self.auto_refresh_enabled.setStyleSheet("""
-            QCheckBox {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-                font-size: 12px;
-                color: #2c3e50;
-            }
-        """)
         refresh_layout.addWidget(self.auto_refresh_enabled)
 
         interval_layout = QHBoxLayout()
         interval_label = QLabel("Refresh interval (minutes):")
-        interval_label.setStyleSheet(
-            "font-family: 'AtkynsonMono Nerd Font Propo', monospace; font-size: 12px; color: #2c3e50;"
-        )
+        interval_label.setObjectName("intervalLabel")
         interval_layout.addWidget(interval_label)
 
         self.refresh_interval_spin = QSpinBox()
         self.refresh_interval_spin.setMinimum(1)
         self.refresh_interval_spin.setMaximum(1440)  # Max 24 hours
         self.refresh_interval_spin.setSuffix(" min")
-        self.refresh_interval_spin.setStyleSheet("""
-            QSpinBox {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-                font-size: 12px;
-                padding: 4px;
-                border: 1px solid #d0d0d0;
-                border-radius: 4px;
-                background-color: #ffffff;
-                color: #2c3e50;
-            }
-            QSpinBox::up-button {
-                background-color: #ecf0f1;
-                border: 1px solid #d0d0d0;
-                border-top-right-radius: 4px;
-                width: 20px;
-                subcontrol-origin: border;
-                subcontrol-position: top right;
-            }
-            QSpinBox::up-button:hover {
-                background-color: #bdc3c7;
-            }
-            QSpinBox::up-button:pressed {
-                background-color: #95a5a6;
-            }
-            QSpinBox::down-button {
-                background-color: #ecf0f1;
-                border: 1px solid #d0d0d0;
-                border-bottom-right-radius: 4px;
-                width: 20px;
-                subcontrol-origin: border;
-                subcontrol-position: bottom right;
-            }
-            QSpinBox::down-button:hover {
-                background-color: #bdc3c7;
-            }
-            QSpinBox::down-button:pressed {
-                background-color: #95a5a6;
-            }
-            QSpinBox::up-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-bottom: 6px solid #2c3e50;
-                width: 0px;
-                height: 0px;
-                margin-left: 2px;
-                margin-right: 2px;
-            }
-            QSpinBox::up-arrow:hover {
-                border-bottom-color: #1a252f;
-            }
-            QSpinBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 6px solid #2c3e50;
-                width: 0px;
-                height: 0px;
-                margin-left: 2px;
-                margin-right: 2px;
-            }
-            QSpinBox::down-arrow:hover {
-                border-top-color: #1a252f;
-            }
-        """)
         interval_layout.addWidget(self.refresh_interval_spin)
         interval_layout.addStretch()
         refresh_layout.addLayout(interval_layout)
@@ -957,59 +1133,19 @@ class MainWindow(QMainWindow):
 
         # Window settings
         window_group = QGroupBox("Window Behavior")
-        window_group.setStyleSheet("""
-            QGroupBox {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-                font-size: 14px;
-                font-weight: bold;
-                color: #2c3e50;
-                border: 2px solid #e0e0e0;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
         window_layout = QVBoxLayout(window_group)
 
         self.stay_on_top_check = QCheckBox("Keep window on top")
-        self.stay_on_top_check.setStyleSheet("""
-            QCheckBox {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-                font-size: 12px;
-                color: #2c3e50;
-            }
-        """)
         window_layout.addWidget(self.stay_on_top_check)
 
         self.run_at_startup_check = QCheckBox("Run at system startup")
-        self.run_at_startup_check.setStyleSheet("""
-            QCheckBox {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-                font-size: 12px;
-                color: #2c3e50;
-            }
-        """)
         window_layout.addWidget(self.run_at_startup_check)
 
         settings_layout.addWidget(window_group)
 
         # Config file path
         config_path_label = QLabel(f"Config file: {self.config_manager.config_path}")
-        config_path_label.setStyleSheet("""
-            QLabel {
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-                font-size: 11px;
-                color: #7f8c8d;
-                background-color: transparent;
-                border: none;
-                padding: 8px 0px;
-            }
-        """)
+        config_path_label.setObjectName("configPathLabel")
         config_path_label.setWordWrap(True)
         settings_layout.addWidget(config_path_label)
 
@@ -1020,55 +1156,14 @@ class MainWindow(QMainWindow):
         button_layout.addStretch()
 
         # Use the exact same height as Hide/Exit buttons
-        # Use self.standard_button_height which was calculated earlier in _setup_ui
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.setStyleSheet(f"""
-            QPushButton {{
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-                font-size: 12px;
-                font-weight: bold;
-                background-color: #95a5a6;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                min-height: {self.standard_button_height}px;
-                max-height: {self.standard_button_height}px;
-                height: {self.standard_button_height}px;
-            }}
-            QPushButton:hover {{
-                background-color: #7f8c8d;
-            }}
-            QPushButton:pressed {{
-                background-color: #6c7a7b;
-            }}
-        """)
+        cancel_btn.setObjectName("settingsCancelButton")
         cancel_btn.setFixedHeight(self.standard_button_height)
         cancel_btn.clicked.connect(self._cancel_settings)
         button_layout.addWidget(cancel_btn)
 
         save_btn = QPushButton("Save")
-        save_btn.setStyleSheet(f"""
-            QPushButton {{
-                font-family: "AtkynsonMono Nerd Font Propo", monospace;
-                font-size: 12px;
-                font-weight: bold;
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                min-height: {self.standard_button_height}px;
-                max-height: {self.standard_button_height}px;
-                height: {self.standard_button_height}px;
-            }}
-            QPushButton:hover {{
-                background-color: #229954;
-            }}
-            QPushButton:pressed {{
-                background-color: #1e8449;
-            }}
-        """)
+        save_btn.setObjectName("settingsSaveButton")
         save_btn.setFixedHeight(self.standard_button_height)
         save_btn.clicked.connect(self._save_settings)
         button_layout.addWidget(save_btn)
@@ -1080,10 +1175,15 @@ class MainWindow(QMainWindow):
 
     def _show_settings(self):
         """Show settings page."""
+        if self.settings_page is None:
+            self.settings_page = self._create_settings_page()
+            self.content_stack.addWidget(self.settings_page)
+
         # Load current settings
-        auto_refresh_interval = self.config_manager.config.get("auto_refresh_interval", 300)
-        stay_on_top = self.config_manager.config.get("stay_on_top", False)
-        run_at_startup = self.config_manager.config.get("run_at_startup", False)
+        cfg = self.config_manager.config
+        auto_refresh_interval = cfg.get("auto_refresh_interval", 300)
+        stay_on_top = cfg.get("stay_on_top", False)
+        run_at_startup = cfg.get("run_at_startup", False)
 
         self.auto_refresh_enabled.setChecked(auto_refresh_interval > 0)
         self.refresh_interval_spin.setValue(
@@ -1092,144 +1192,118 @@ class MainWindow(QMainWindow):
         self.stay_on_top_check.setChecked(stay_on_top)
         self.run_at_startup_check.setChecked(run_at_startup)
 
-        # Show settings page, hide cards
-        self.settings_page.show()
-        self.scroll_area.hide()
+        # Show settings page in place of the cards
+        self.content_stack.setCurrentWidget(self.settings_page)
 
     def _cancel_settings(self):
         """Cancel settings changes and return to cards view."""
-        self.settings_page.hide()
-        self.scroll_area.show()
+        if self.settings_page is None:
+            return  # Settings were never opened
+        self.content_stack.setCurrentWidget(self.scroll_area)
 
     def _save_settings(self):
         """Save settings and return to cards view."""
-        # Save auto-refresh settings
+        if self.settings_page is None:
+            return  # Settings were never opened; there is nothing to read
+        # Read every setting from the UI first, then persist with a single write
         if self.auto_refresh_enabled.isChecked():
             interval_seconds = self.refresh_interval_spin.value() * 60
-            self.config_manager.config["auto_refresh_interval"] = interval_seconds
-            self.refresh_timer.setInterval(interval_seconds * 1000)
-            if not self.refresh_timer.isActive():
-                self.refresh_timer.start()
         else:
-            self.config_manager.config["auto_refresh_interval"] = 0
-            self.refresh_timer.stop()
-
-        # Save stay on top setting
+            interval_seconds = 0
         stay_on_top = self.stay_on_top_check.isChecked()
-        self.config_manager.config["stay_on_top"] = stay_on_top
+        run_at_startup = self.run_at_startup_check.isChecked()
+
+        self.config_manager.config.update(
+            {
+                "auto_refresh_interval": interval_seconds,
+                "stay_on_top": stay_on_top,
+                "run_at_startup": run_at_startup,
+            }
+        )
         self.config_manager.save_config()
 
-        # Apply stay on top
-        if stay_on_top:
-            self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)
+        # Apply side effects only after the config is on disk
+        if interval_seconds > 0:
+            # Sets the interval and (re)starts; setInterval restarts a running timer anyway
+            self.refresh_timer.start(interval_seconds * 1000)
         else:
-            self.setWindowFlags(self.windowFlags() & ~Qt.WindowStaysOnTopHint)
-        self.show()  # Required to apply window flag changes
+            self.refresh_timer.stop()
 
-        # Save and apply run at startup setting
-        run_at_startup = self.run_at_startup_check.isChecked()
-        self.config_manager.config["run_at_startup"] = run_at_startup
-        self.config_manager.save_config()
-        self._set_run_at_startup(run_at_startup)
+        # Re-show (if the flag changed) and switch back to the cards view as
+        # one repaint rather than painting the settings page and then the cards
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply_stay_on_top(stay_on_top)
+            self.content_stack.setCurrentWidget(self.scroll_area)
+        finally:
+            self.setUpdatesEnabled(True)
 
-        # Return to cards view
-        self.settings_page.hide()
-        self.scroll_area.show()
+        self._set_run_at_startup(run_at_startup)
 
     def _set_run_at_startup(self, enable: bool):
-        """Enable or disable running at system startup (macOS Launch Agent)."""
+        """Enable or disable running at system startup (macOS Launch Agent).
+
+        The plist write and launchctl call run on a LaunchAgentWorker thread;
+        paths are resolved here on the GUI thread and errors come back via signal.
+        """
         if platform.system() != "Darwin":  # macOS only
             return
+        if self._startup_workers:
+            # One Launch Agent change at a time so an install and a removal can't
+            # race; the latest request is applied when the running one finishes
+            self._pending_run_at_startup = enable
+            return
+        if enable == self._last_run_at_startup_state:
+            return  # Already applied this session
 
-        try:
-            launch_agents_dir = Path.home() / "Library" / "LaunchAgents"
-            launch_agents_dir.mkdir(parents=True, exist_ok=True)
-
-            # Use a unique identifier for the plist file
-            plist_name = "com.checkclouddrives.plist"
-            plist_path = launch_agents_dir / plist_name
-
-            if enable:
-                # Get the path to the run.sh script
-                project_root = Path(__file__).parent.parent.parent.parent
-                script_path = project_root / "run.sh"
-
-                if script_path.exists():
-                    # Use the run.sh script
-                    script_path = script_path.resolve()
-                    # Use bash to execute the script
-                    plist_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>com.checkclouddrives</string>
-    <key>ProgramArguments</key>
-    <array>
-        <string>/bin/bash</string>
-        <string>{script_path}</string>
-    </array>
-    <key>RunAtLoad</key>
-    <true/>
-    <key>KeepAlive</key>
-    <false/>
-    <key>WorkingDirectory</key>
-    <string>{project_root}</string>
-</dict>
-</plist>
-"""
-                else:
-                    # Fallback: use Python with module
-                    python_path = Path(sys.executable).resolve()
-                    plist_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>com.checkclouddrives</string>
-    <key>ProgramArguments</key>
-    <array>
-        <string>{python_path}</string>
-        <string>-m</string>
-        <string>check_cloud_drives.main</string>
-    </array>
-    <key>RunAtLoad</key>
-    <true/>
-    <key>KeepAlive</key>
-    <false/>
-    <key>WorkingDirectory</key>
-    <string>{project_root}</string>
-</dict>
-</plist>
-"""
-                with open(plist_path, "w") as f:
-                    f.write(plist_content)
+        plist_path = launch_agent_path()
+        if not enable and not plist_path.exists():
+            # Nothing installed, so there is nothing to unload; skip the worker thread
+            self._last_run_at_startup_state = enable
+            return
 
-                # Load the launch agent
-                subprocess.run(["launchctl", "load", str(plist_path)], check=False)
+        script_path = None
+        python_path = None
+        if enable:
+            # The only filesystem check left per toggle
+            if _RUN_SCRIPT.exists():
+                script_path = _RUN_SCRIPT
             else:
-                # Unload and remove the launch agent
-                if plist_path.exists():
-                    subprocess.run(["launchctl", "unload", str(plist_path)], check=False)
-                    plist_path.unlink()
-        except Exception as e:
-            print(f"Error setting run at startup: {e}")
-            QMessageBox.warning(
-                self,
-                "Startup Setting Error",
-                f"Could not {'enable' if enable else 'disable'} run at startup:\n{e}",
-            )
+                python_path = _PYTHON
+
+        worker = LaunchAgentWorker(enable, plist_path, _PROJECT_ROOT, script_path, python_path)
+        worker.error.connect(self._on_startup_error)
+        worker.finished.connect(lambda: self._cleanup_startup_worker(worker))
+        worker.start()
+        self._startup_workers.add(worker)
+        self._last_run_at_startup_state = enable
+
+    def _on_startup_error(self, enable: bool, message: str):
+        """Report a failed Launch Agent change (runs on the GUI thread)."""
+        self._last_run_at_startup_state = None  # Retry on the next save
+        QMessageBox.warning(
+            self,
+            "Startup Setting Error",
+            f"Could not {'enable' if enable else 'disable'} run at startup:\n{message}",
+        )
+
+    def _cleanup_startup_worker(self, worker: LaunchAgentWorker):
+        """Release a finished Launch Agent worker and apply any queued request."""
+        self._startup_workers.discard(worker)
+        worker.deleteLater()
+        pending, self._pending_run_at_startup = self._pending_run_at_startup, None
+        if pending is not None:
+            self._set_run_at_startup(pending)
 
     def _restore_geometry(self):
         """Restore window geometry from config, or position on right side by default."""
         geometry = self.config_manager.get_window_geometry()
         if geometry:
-            self.setGeometry(
-                geometry.get("x", 100),
-                geometry.get("y", 100),
-                geometry.get("width", 450),
-                geometry.get("height", 600),
-            )
+            x = geometry.get("x", 100)
+            y = geometry.get("y", 100)
+            width = geometry.get("width", 450)
+            height = geometry.get("height", 600)
+            self.setGeometry(x, y, width, height)
         else:
             # Default: position on right side of screen
             screen = QApplication.primaryScreen().geometry()
@@ -1240,7 +1314,7 @@ class MainWindow(QMainWindow):
             self.setGeometry(x, y, window_width, window_height)
 
         if self.config_manager.get_stay_on_top():
-            self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)
+            self._apply_stay_on_top(True)
 
     def _title_mouse_press(self, event):
         """Handle mouse press on title for window dragging."""
@@ -1252,26 +1326,38 @@ class MainWindow(QMainWindow):
     def _title_mouse_move(self, event):
         """Handle mouse move on title for window dragging."""
         if self.is_dragging and event.buttons() == Qt.LeftButton:
-            new_pos = event.globalPosition().toPoint() - self.drag_position
-            self.move(new_pos)
+            # Keep only the latest target; at most one move() per event-loop pass
+            self._pending_move_pos = event.globalPosition().toPoint() - self.drag_position
+            if not self._move_scheduled:
+                self._move_scheduled = True
+                QTimer.singleShot(0, self._flush_move)
             event.accept()
 
+    def _flush_move(self):
+        """Apply the most recent drag position, if any."""
+        self._move_scheduled = False
+        pos = self._pending_move_pos
+        if pos is not None:
+            self._pending_move_pos = None
+            # Jitter-free or repeated events can land on the current position
+            if pos != self.pos():
+                self.move(pos)
+
     def _title_mouse_release(self, event):
         """Handle mouse release on title and snap to screen edge if near."""
         if self.is_dragging:
             self.is_dragging = False
+            self._flush_move()  # Snap from the final drag position
             self._snap_to_edge()
         event.accept()
 
     def _show_overlay(self):
         """Show the dimming overlay over the main window."""
         if hasattr(self, "overlay"):
-            central = self.centralWidget()
-            if central:
-                # Position overlay to cover entire central widget
-                self.overlay.setGeometry(0, 0, central.width(), central.height())
-                self.overlay.show()
-                self.overlay.raise_()  # Bring to front
+            # Position overlay to cover entire central widget (its parent)
+            self.overlay.setGeometry(self._central.rect())
+            self.overlay.show()
+            self.overlay.raise_()  # Bring to front
 
     def _hide_overlay(self):
         """Hide the dimming overlay."""
@@ -1282,38 +1368,73 @@ class MainWindow(QMainWindow):
         """Handle window resize to update overlay size."""
         super().resizeEvent(event)
         if hasattr(self, "overlay") and self.overlay.isVisible():
-            central = self.centralWidget()
-            if central:
-                self.overlay.setGeometry(central.geometry())
+            # The overlay is a child of the central widget, so use its local rect
+            self.overlay.setGeometry(self._central.rect())
+
+    def showEvent(self, event):
+        """Start tracking screen changes once the native window exists."""
+        super().showEvent(event)
+        if not self._screen_tracking:
+            handle = self.windowHandle()
+            if handle is not None:
+                handle.screenChanged.connect(self._on_screen_changed)
+                self._on_screen_changed(handle.screen())
+                self._screen_tracking = True
+
+    def _on_screen_changed(self, screen):
+        """Drop cached screen edges when the window moves to another screen."""
+        self._screen_edges = None
+        if screen is self._tracked_screen:
+            return
+        if self._tracked_screen is not None:
+            self._tracked_screen.geometryChanged.disconnect(self._invalidate_screen_edges)
+        self._tracked_screen = screen
+        if screen is not None:
+            # Resolution/arrangement changes on the new screen invalidate too
+            screen.geometryChanged.connect(self._invalidate_screen_edges)
+
+    def _invalidate_screen_edges(self, *_):
+        """Forget cached screen edges so the next snap re-reads them."""
+        self._screen_edges = None
+
+    def _refresh_screen_edges(self) -> tuple[int, int, int, int]:
+        """Cache the (left, top, right, bottom) edges of the window's screen."""
+        screen = self.screen() or QApplication.primaryScreen()
+        geo = screen.geometry()
+        self._screen_edges = (geo.left(), geo.top(), geo.right(), geo.bottom())
+        return self._screen_edges
 
     def _snap_to_edge(self):
         """Snap window to screen edge if close enough."""
-        screen = QApplication.primaryScreen().geometry()
+        screen_left, screen_top, screen_right, screen_bottom = (
+            self._screen_edges or self._refresh_screen_edges()
+        )
         window_geo = self.geometry()
-
-        # Check left edge
-        if abs(window_geo.left() - screen.left()) < self.edge_snap_threshold:
-            self.move(screen.left(), window_geo.top())
-        # Check right edge
-        elif abs(window_geo.right() - screen.right()) < self.edge_snap_threshold:
-            self.move(screen.right() - window_geo.width(), window_geo.top())
-        # Check top edge
-        elif abs(window_geo.top() - screen.top()) < self.edge_snap_threshold:
-            self.move(window_geo.left(), screen.top())
-        # Check bottom edge
-        elif abs(window_geo.bottom() - screen.bottom()) < self.edge_snap_threshold:
-            self.move(window_geo.left(), screen.bottom() - window_geo.height())
+        left = window_geo.left()
+        top = window_geo.top()
+
+        # Distance to each edge (left, right, top, bottom) and the position the
+        # window snaps to there; snap to the nearest one if within the threshold
+        distance, x, y = min(
+            (abs(left - screen_left), screen_left, top),
+            (abs(window_geo.right() - screen_right), screen_right - window_geo.width(), top),
+            (abs(top - screen_top), left, screen_top),
+            (abs(window_geo.bottom() - screen_bottom), left, screen_bottom - window_geo.height()),
+        )
+        if distance < self.edge_snap_threshold:
+            self.move(x, y)
 
     def closeEvent(self, event):
         """Handle window close event."""
-        # Save geometry
-        geo = self.geometry()
-        self.config_manager.set_window_geometry(
-            {"x": geo.x(), "y": geo.y(), "width": geo.width(), "height": geo.height()}
-        )
-
-        # Save drive order before closing/hiding
-        self._save_drive_order()
+        # Regular saves skip fsync; write geometry and drive order in one
+        # durable save so everything is on disk now
+        with self.config_manager.batch(durable=True):
+            geo = self.geometry()
+            self.config_manager.set_window_geometry(
+                {"x": geo.x(), "y": geo.y(), "width": geo.width(), "height": geo.height()}
+            )
+            # Save drive order before closing/hiding
+            self._flush_pending_saves()
 
         # Stop all running worker threads before closing
         self._stop_all_workers()
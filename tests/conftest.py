@@ -1,25 +1,38 @@
 """Pytest configuration and shared fixtures."""
 
+import os
+import sys
 import tempfile
 from pathlib import Path
 
 import pytest
 
+# Render Qt widgets into in-process buffers on CI and headless Linux; this must
+# happen before anything imports PySide6. An explicit QT_QPA_PLATFORM wins.
+if "CI" in os.environ or (
+    sys.platform.startswith("linux")
+    and not os.environ.get("DISPLAY")
+    and not os.environ.get("WAYLAND_DISPLAY")
+):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
 
 @pytest.fixture
 def temp_config_file():
-    """Create a temporary config file for testing."""
-    with tempfile.NamedTemporaryFile(mode="wb", suffix=".toml", delete=False) as f:
-        config_path = Path(f.name)
-    yield config_path
-    # Cleanup
-    if config_path.exists():
-        config_path.unlink()
+    """Path to a not-yet-created config file in a fresh temporary directory.
+
+    The directory (and anything a test writes next to the file) is removed afterwards.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        yield Path(tmp_dir) / "config.toml"
 
 
 @pytest.fixture
 def sample_drive_config():
-    """Create a sample DriveConfig for testing."""
+    """Create a sample DriveConfig for testing.
+
+    Function-scoped: DriveCard edits write back to its drive_config.
+    """
     from check_cloud_drives.models import DriveConfig
 
     return DriveConfig(
@@ -30,9 +43,12 @@ def sample_drive_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_drive_status():
-    """Create a sample DriveStatus for testing."""
+    """Create a sample DriveStatus for testing.
+
+    Session-scoped and shared by every test, so treat it as read-only.
+    """
     from check_cloud_drives.models import DriveStatus
 
     return DriveStatus(
@@ -46,3 +62,30 @@ def sample_drive_status():
         last_updated="2024-01-15 14:30:00",
         error=None,
     )
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Create the QApplication once for the whole test session.
+
+    Qt allows only one QApplication per process, so every Qt test shares it;
+    under pytest-xdist each worker process creates its own.
+    Menu, combo, tooltip and toolbox animations are switched off so nothing
+    in a test waits on an effect to finish.
+    """
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    for effect in (
+        Qt.UI_AnimateMenu,
+        Qt.UI_FadeMenu,
+        Qt.UI_AnimateCombo,
+        Qt.UI_AnimateTooltip,
+        Qt.UI_FadeTooltip,
+        Qt.UI_AnimateToolBox,
+    ):
+        QApplication.setEffectEnabled(effect, False)
+    return app
@@ -1,31 +1,98 @@
 """Tests for DriveCard UI component."""
 
 import pytest
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QApplication
 
 from check_cloud_drives.models import DriveStatus
-from check_cloud_drives.ui.card import DriveCard
 
+# Skip (rather than error) when PySide6 isn't installed; DriveCard itself is
+# imported inside the fixture so collecting this file stays cheap
+Qt = pytest.importorskip("PySide6.QtCore").Qt
 
-@pytest.fixture(scope="module")
-def qapp():
-    """Create QApplication instance for tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    return app
+# Needs the Qt event loop; deselect with -m "not qt"
+pytestmark = pytest.mark.qt
 
 
 @pytest.fixture
 def drive_card(qapp, sample_drive_config):
-    """Create a DriveCard instance for testing."""
-    return DriveCard(sample_drive_config)
+    """Create a DriveCard instance for testing.
+
+    Each test gets a fresh card because most of them change its edit mode,
+    names, status or signal connections; the card is released afterwards so
+    widgets don't pile up across the session.
+    """
+    from check_cloud_drives.ui.card import DriveCard
+
+    card = DriveCard(sample_drive_config)
+    yield card
+    card.close()
+    card.deleteLater()
+
+
+def _ensure_laid_out(card, host):
+    """Show card inside the exposed host with its geometry already applied.
+
+    Activating the host layout directly settles sizes without spinning the
+    event loop or waiting for another expose.
+    """
+    host.layout().addWidget(card)
+    card.show()
+    host.layout().activate()
+
+
+def _take_out(card, host):
+    """Detach card from host again so its own teardown can release it."""
+    host.layout().removeWidget(card)
+    card.setParent(None)
+
+
+@pytest.fixture(scope="session")
+def card_host(qapp):
+    """Top-level window that is shown and exposed once for the whole session.
+
+    Cards placed inside it become visible without an expose round-trip with
+    the window system of their own.
+    """
+    from PySide6.QtTest import QTest
+    from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+    host = QWidget()
+    QVBoxLayout(host)
+    host.show()
+    host.activateWindow()
+    QTest.qWaitForWindowExposed(host)
+    yield host
+    host.close()
+    host.deleteLater()
+
+
+@pytest.fixture
+def shown_card(drive_card, card_host):
+    """The drive_card fixture, shown inside the already-exposed card_host."""
+    _ensure_laid_out(drive_card, card_host)
+    yield drive_card
+    _take_out(drive_card, card_host)
 
 
 class TestDriveCard:
     """Test suite for DriveCard UI component."""
 
+    def test_deleted_card_drops_startup_timers(self, qapp, qtbot, sample_drive_config):
+        """Test that a card deleted right away doesn't run its deferred label updates.
+
+        The drive_card fixture releases cards as soon as a test ends, well before
+        the card's startup timers would fire; pytest-qt fails the test if one of
+        them touches the deleted card.
+        """
+        from PySide6.QtCore import QCoreApplication, QEvent
+
+        from check_cloud_drives.ui.card import DriveCard
+
+        card = DriveCard(sample_drive_config)
+        card.deleteLater()
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+        qtbot.wait(300)  # Past the 100/150 ms startup timers
+
     def test_card_initialization(self, drive_card, sample_drive_config):
         """Test that DriveCard initializes correctly."""
         assert drive_card.drive_config == sample_drive_config
@@ -72,37 +139,32 @@ class TestDriveCard:
         assert drive_card.drive_config.remote_name == new_remote
         assert new_remote in drive_card.remote_name_label.text()
 
-    def test_enter_edit_mode(self, drive_card, qtbot):
+    def test_enter_edit_mode(self, shown_card, qtbot):
         """Test entering edit mode."""
-        drive_card.show()  # Widget must be shown for visibility to work
-        qtbot.waitExposed(drive_card)
-
-        assert drive_card.is_edit_mode is False
-        drive_card._enter_edit_mode()
-        qtbot.wait(100)  # Wait for layout updates
-
-        assert drive_card.is_edit_mode is True
-        assert drive_card.display_name_label.isVisible() is False
-        assert drive_card.remote_name_label.isVisible() is False
+        assert shown_card.is_edit_mode is False
+        shown_card._enter_edit_mode()
+        # Returns as soon as the layout has swapped in the editor
+        qtbot.wait_until(lambda: not shown_card.display_name_label.isVisible(), timeout=1000)
+
+        assert shown_card.is_edit_mode is True
+        assert shown_card.display_name_label.isVisible() is False
+        assert shown_card.remote_name_label.isVisible() is False
         # edit_mode_container should be in layout and visible
-        assert drive_card.edit_mode_container.parent() is not None
+        assert shown_card.edit_mode_container.parent() is not None
 
-    def test_exit_edit_mode(self, drive_card, qtbot):
+    def test_exit_edit_mode(self, shown_card, qtbot):
         """Test exiting edit mode."""
-        drive_card.show()  # Widget must be shown for visibility to work
-        qtbot.waitExposed(drive_card)
+        shown_card._enter_edit_mode()
+        qtbot.wait_until(lambda: not shown_card.display_name_label.isVisible(), timeout=1000)
+        assert shown_card.is_edit_mode is True
 
-        drive_card._enter_edit_mode()
-        qtbot.wait(100)
-        assert drive_card.is_edit_mode is True
-
-        drive_card._exit_edit_mode()
-        qtbot.wait(100)  # Wait for layout updates
+        shown_card._exit_edit_mode()
+        qtbot.wait_until(lambda: shown_card.display_name_label.isVisible(), timeout=1000)
 
-        assert drive_card.is_edit_mode is False
+        assert shown_card.is_edit_mode is False
         # After exit, normal widgets should be visible
-        assert drive_card.display_name_label.parent() is not None
-        assert drive_card.remote_name_label.parent() is not None
+        assert shown_card.display_name_label.parent() is not None
+        assert shown_card.remote_name_label.parent() is not None
 
     def test_save_edit_with_valid_text(self, drive_card, qtbot):
         """Test saving edit with valid text."""
@@ -110,60 +172,36 @@ class TestDriveCard:
         new_title = "New Title"
         drive_card.title_edit.setPlainText(new_title)
 
-        # Connect to signal to verify it's emitted
-        signal_received = False
-        saved_name = None
-
-        def on_saved(name):
-            nonlocal signal_received, saved_name
-            signal_received = True
-            saved_name = name
+        with qtbot.waitSignal(drive_card.display_name_saved, timeout=500) as blocker:
+            drive_card._save_edit()
 
-        drive_card.display_name_saved.connect(on_saved)
-        drive_card._save_edit()
-
-        assert signal_received
-        assert saved_name == new_title
+        assert blocker.args == [new_title]
         assert drive_card.drive_config.display_name == new_title
         assert drive_card.is_edit_mode is False
 
-    def test_save_edit_with_empty_text(self, drive_card):
+    def test_save_edit_with_empty_text(self, drive_card, qtbot):
         """Test that saving edit with empty text doesn't save."""
         original_name = drive_card.drive_config.display_name
         drive_card._enter_edit_mode()
         drive_card.title_edit.setPlainText("")
 
-        signal_received = False
-
-        def on_saved(name):
-            nonlocal signal_received
-            signal_received = True
-
-        drive_card.display_name_saved.connect(on_saved)
-        drive_card._save_edit()
-
         # Should not emit signal and stay in edit mode
-        assert not signal_received
+        with qtbot.assertNotEmitted(drive_card.display_name_saved):
+            drive_card._save_edit()
+
         assert drive_card.drive_config.display_name == original_name
         assert drive_card.is_edit_mode is True
 
-    def test_save_edit_with_whitespace_only(self, drive_card):
+    def test_save_edit_with_whitespace_only(self, drive_card, qtbot):
         """Test that saving edit with whitespace-only text doesn't save."""
         original_name = drive_card.drive_config.display_name
         drive_card._enter_edit_mode()
         drive_card.title_edit.setPlainText("   ")
 
-        signal_received = False
-
-        def on_saved(name):
-            nonlocal signal_received
-            signal_received = True
-
-        drive_card.display_name_saved.connect(on_saved)
-        drive_card._save_edit()
-
         # Should not emit signal
-        assert not signal_received
+        with qtbot.assertNotEmitted(drive_card.display_name_saved):
+            drive_card._save_edit()
+
         assert drive_card.drive_config.display_name == original_name
 
     def test_cancel_edit(self, drive_card):
@@ -180,35 +218,25 @@ class TestDriveCard:
 
     def test_remove_card_emits_signal(self, drive_card, qtbot):
         """Test that removing card emits signal."""
-        signal_received = False
-
-        def on_removed():
-            nonlocal signal_received
-            signal_received = True
-
-        drive_card.card_removed.connect(on_removed)
         drive_card._enter_edit_mode()
-        drive_card._remove_card()
+        with qtbot.waitSignal(drive_card.card_removed, timeout=500):
+            drive_card._remove_card()
 
-        assert signal_received
         assert drive_card.is_edit_mode is False
 
-    def test_update_status(self, drive_card, sample_drive_status, qtbot):
+    def test_update_status(self, shown_card, sample_drive_status, qtbot):
         """Test updating drive status."""
-        drive_card.show()  # Widget must be shown for visibility to work
-        qtbot.waitExposed(drive_card)
-
-        drive_card.update_status(sample_drive_status)
-        qtbot.wait(100)  # Wait for UI updates
+        shown_card.update_status(sample_drive_status)
+        qtbot.wait_until(lambda: shown_card.free_space_label.isVisible(), timeout=1000)
 
-        assert drive_card.drive_status == sample_drive_status
+        assert shown_card.drive_status == sample_drive_status
         # free_space_label should be visible if free value is valid
         if sample_drive_status.free and sample_drive_status.free != "Unknown":
-            assert drive_card.free_space_label.isVisible() is True
+            assert shown_card.free_space_label.isVisible() is True
             # Check that free space is displayed
             assert (
-                sample_drive_status.free in drive_card.free_space_label.text()
-                or "Free:" in drive_card.free_space_label.text()
+                sample_drive_status.free in shown_card.free_space_label.text()
+                or "Free:" in shown_card.free_space_label.text()
             )
 
     def test_update_status_with_error(self, drive_card):
@@ -234,35 +262,29 @@ class TestDriveCard:
         drive_card.set_updating(False)
         assert drive_card.is_updating is False
 
-    def test_edit_mode_preserves_card_height(self, drive_card):
+    def test_edit_mode_preserves_card_height(self, shown_card):
         """Test that entering edit mode preserves card height."""
-        # Show the card to get a real height
-        drive_card.show()
-
-        drive_card._enter_edit_mode()
+        shown_card._enter_edit_mode()
         # Height should be fixed and similar to original
-        assert drive_card.height() > 0
+        assert shown_card.height() > 0
 
-        drive_card._exit_edit_mode()
+        shown_card._exit_edit_mode()
         # Height should be restored (or at least not fixed)
         # Note: After exit, height might be different due to layout, but should be reasonable
 
-    def test_edit_mode_title_edit_has_focus(self, drive_card, qtbot):
+    def test_edit_mode_title_edit_has_focus(self, shown_card, qtbot):
         """Test that title edit gets focus when entering edit mode."""
-        drive_card.show()  # Widget must be shown for focus to work
-        qtbot.waitExposed(drive_card)
-
-        drive_card._enter_edit_mode()
-        qtbot.wait(100)  # Wait for focus to be set
+        shown_card._enter_edit_mode()
+        qtbot.wait_until(lambda: shown_card.title_edit.isVisible(), timeout=1000)
 
         # Focus might not be set immediately, but title_edit should exist and be in edit mode
-        assert drive_card.title_edit is not None
-        assert drive_card.is_edit_mode is True
+        assert shown_card.title_edit is not None
+        assert shown_card.is_edit_mode is True
         # Try to verify focus was requested (may need processing)
-        qtbot.mouseClick(drive_card.title_edit, Qt.LeftButton)
-        qtbot.wait(50)
+        qtbot.mouseClick(shown_card.title_edit, Qt.LeftButton)
         # After click, it should have focus
-        assert drive_card.title_edit.hasFocus() is True
+        qtbot.wait_until(shown_card.title_edit.hasFocus, timeout=1000)
+        assert shown_card.title_edit.hasFocus() is True
 
     def test_edit_mode_title_edit_has_correct_text(self, drive_card):
         """Test that title edit is populated with current display name."""
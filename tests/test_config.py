@@ -9,9 +9,7 @@ class TestConfigManager:
 
     def test_init_with_nonexistent_file(self, temp_config_file):
         """Test ConfigManager initialization with non-existent file creates default config."""
-        # Remove the file if it exists
-        if temp_config_file.exists():
-            temp_config_file.unlink()
+        assert not temp_config_file.exists()
 
         manager = ConfigManager(temp_config_file)
         assert manager.config == {
@@ -140,6 +138,35 @@ auto_refresh_interval = 600
         assert deep_path.exists()
         assert deep_path.parent.exists()
 
+    def test_save_config_recreates_removed_directory(self, temp_config_file):
+        """Test that a save after the config directory was removed recreates it."""
+        config_path = temp_config_file.parent / "app" / "config.toml"
+        manager = ConfigManager(config_path)
+        manager.set_stay_on_top(True)
+        config_path.unlink()
+        config_path.parent.rmdir()
+
+        manager.set_stay_on_top(False)
+
+        assert ConfigManager(config_path).get_stay_on_top() is False
+
+    def test_save_config_is_atomic(self, temp_config_file):
+        """Test that save_config replaces the file and leaves no temp file behind."""
+        manager = ConfigManager(temp_config_file)
+        manager.set_stay_on_top(True)
+
+        tmp_path = temp_config_file.with_name(temp_config_file.name + ".tmp")
+        assert not tmp_path.exists()
+        assert ConfigManager(temp_config_file).get_stay_on_top() is True
+
+    def test_save_config_durable(self, temp_config_file):
+        """Test that a durable save writes the same content."""
+        manager = ConfigManager(temp_config_file)
+        manager.config["stay_on_top"] = True
+        manager.save_config(durable=True)
+
+        assert ConfigManager(temp_config_file).get_stay_on_top() is True
+
     def test_prepare_for_toml_handles_none(self, temp_config_file):
         """Test _prepare_for_toml handles None values correctly."""
         manager = ConfigManager(temp_config_file)
@@ -177,3 +204,41 @@ auto_refresh_interval = 600
         assert manager2.get_drives()[0].remote_name == "persistent_remote"
         assert manager2.get_stay_on_top() is True
         assert manager2.get_drive_order() == ["persistent_remote"]
+
+    def test_prepare_for_toml_reuses_clean_parts(self, temp_config_file):
+        """Test _prepare_for_toml doesn't copy parts that need no changes."""
+        manager = ConfigManager(temp_config_file)
+        manager.set_drives([DriveConfig("remote1", "Drive 1")])
+        manager.config["drive_order"] = ["remote1"]
+
+        prepared = manager._prepare_for_toml(manager.config)
+        assert prepared["drive_order"] is manager.config["drive_order"]
+        assert prepared["drives"][0] is manager.config["drives"][0]
+
+    def test_batch_saves_once(self, temp_config_file, monkeypatch):
+        """Test that setters inside batch() write the file once, at the end."""
+        manager = ConfigManager(temp_config_file)
+        saves = []
+        monkeypatch.setattr(manager, "save_config", lambda durable=False: saves.append(durable))
+
+        with manager.batch():
+            manager.set_drives([DriveConfig("remote1", "Drive 1")])
+            with manager.batch():
+                manager.set_stay_on_top(True)
+            manager.set_drive_order(["remote1"])
+            assert saves == []
+
+        assert saves == [False]
+
+    def test_batch_durable_without_changes(self, temp_config_file, monkeypatch):
+        """Test that a durable batch saves even when no setter ran."""
+        manager = ConfigManager(temp_config_file)
+        saves = []
+        monkeypatch.setattr(manager, "save_config", lambda durable=False: saves.append(durable))
+
+        with manager.batch():
+            pass
+        with manager.batch(durable=True):
+            pass
+
+        assert saves == [True]
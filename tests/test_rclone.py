@@ -1,208 +1,245 @@
 """Tests for rclone integration."""
 
+import subprocess
+import sys
+
 import pytest
 
-from check_cloud_drives.rclone import RcloneWorker
+from check_cloud_drives import rclone
+from check_cloud_drives.models import DriveStatus
+from check_cloud_drives.rclone import RcloneWorker, RemoteListWorker
+
+_KEYS = ("total", "used", "free", "trash", "other", "objects")
+_UNKNOWN = dict.fromkeys(_KEYS, "Unknown")
+
+# (output, expected fields) for the parser
+_ABOUT_CASES = [
+    pytest.param(
+        "Total:   100 GB\nUsed:    50 GB\nFree:    50 GB\n"
+        "Trash:   1 GB\nOther:   0 GB\nObjects: 1000\n",
+        {
+            "total": "100 GB",
+            "used": "50 GB",
+            "free": "50 GB",
+            "trash": "1 GB",
+            "other": "0 GB",
+            "objects": "1000",
+        },
+        id="success",
+    ),
+    pytest.param(
+        "TOTAL:   200 GB\nUSED:    100 GB\nFREE:    100 GB\n",
+        {**_UNKNOWN, "total": "200 GB", "used": "100 GB", "free": "100 GB"},
+        id="case_insensitive",
+    ),
+    pytest.param(
+        "Total:   100 GB\nUsed:    50 GB\n",
+        {**_UNKNOWN, "total": "100 GB", "used": "50 GB"},
+        id="missing_fields",
+    ),
+    pytest.param("", _UNKNOWN, id="empty"),
+    pytest.param(
+        "Some random text\nNot in expected format\nTotal: 100 GB (but with extra text)\n",
+        {**_UNKNOWN, "total": "100 GB (but with extra text)"},
+        id="malformed",
+    ),
+    pytest.param(
+        "Total:   100 GB: Extra info\nUsed:    50 GB\n",
+        # Only split on first colon
+        {**_UNKNOWN, "total": "100 GB: Extra info", "used": "50 GB"},
+        id="colon_in_value",
+    ),
+    pytest.param(
+        "Total:     100 GB\nUsed:      50 GB\nFree:      50 GB\n",
+        {**_UNKNOWN, "total": "100 GB", "used": "50 GB", "free": "50 GB"},
+        id="multiple_spaces",
+    ),
+    pytest.param(
+        "  Total: 100 GB\r\nFree : 60 GB \r\n",
+        {**_UNKNOWN, "total": "100 GB", "free": "60 GB"},
+        id="crlf_and_indent",
+    ),
+]
+
+
+def _py(code: str) -> list[str]:
+    """Command running a Python one-liner; portable where echo/sleep aren't."""
+    return [sys.executable, "-c", code]
+
+
+@pytest.fixture(scope="module")
+def parse_worker():
+    """One RcloneWorker shared by the parser tests, which never start or connect it."""
+    return RcloneWorker(["rclone", "about", "test:"], "test_remote")
 
 
 class TestRcloneWorker:
     """Test suite for RcloneWorker."""
 
-    def test_parse_about_output_success(self):
-        """Test parsing successful rclone about output."""
-        output = """Total:   100 GB
-Used:    50 GB
-Free:    50 GB
-Trash:   1 GB
-Other:   0 GB
-Objects: 1000
-"""
-        worker = RcloneWorker(["rclone", "about", "test:"], "test_remote")
-        result = worker._parse_about_output(output)
+    @pytest.mark.parametrize(("output", "expected"), _ABOUT_CASES)
+    def test_parse_about_output(self, parse_worker, output, expected):
+        """Test parsing rclone about output."""
+        result = parse_worker._parse_about_output(output)
+
+        assert {key: result[key] for key in _KEYS} == expected
+        assert result["raw"] == output
+
+    def test_parse_about_output_bytes(self, parse_worker):
+        """Test that raw bytes parse like text, decoding only the values."""
+        result = parse_worker._parse_about_output("Total: 100 GB\nOther: 1 Gö\n".encode())
 
         assert result["total"] == "100 GB"
-        assert result["used"] == "50 GB"
-        assert result["free"] == "50 GB"
-        assert result["trash"] == "1 GB"
-        assert result["other"] == "0 GB"
-        assert result["objects"] == "1000"
-        assert "raw" in result
-
-    def test_parse_about_output_case_insensitive(self):
-        """Test that parsing is case-insensitive."""
-        output = """TOTAL:   200 GB
-USED:    100 GB
-FREE:    100 GB
-"""
-        worker = RcloneWorker(["rclone", "about", "test:"], "test_remote")
-        result = worker._parse_about_output(output)
+        assert result["other"] == "1 Gö"
+        assert result["raw"] == "Total: 100 GB\nOther: 1 Gö\n"
 
-        assert result["total"] == "200 GB"
-        assert result["used"] == "100 GB"
-        assert result["free"] == "100 GB"
+    def test_build_status(self, parse_worker):
+        """Test that parsed about output becomes a timestamped DriveStatus."""
+        parsed = parse_worker._parse_about_output("Total: 100 GB\nUsed: 40 GB\nFree: 60 GB\n")
 
-    def test_parse_about_output_missing_fields(self):
-        """Test parsing output with missing fields."""
-        output = """Total:   100 GB
-Used:    50 GB
-"""
-        worker = RcloneWorker(["rclone", "about", "test:"], "test_remote")
-        result = worker._parse_about_output(output)
+        status = parse_worker._build_status(parsed)
 
-        assert result["total"] == "100 GB"
-        assert result["used"] == "50 GB"
-        assert result["free"] == "Unknown"  # Missing field
-        assert result["trash"] == "Unknown"
-        assert result["other"] == "Unknown"
-        assert result["objects"] == "Unknown"
-
-    def test_parse_about_output_empty(self):
-        """Test parsing empty output."""
-        worker = RcloneWorker(["rclone", "about", "test:"], "test_remote")
-        result = worker._parse_about_output("")
-
-        assert result["total"] == "Unknown"
-        assert result["used"] == "Unknown"
-        assert result["free"] == "Unknown"
-        assert result["trash"] == "Unknown"
-        assert result["other"] == "Unknown"
-        assert result["objects"] == "Unknown"
-
-    def test_parse_about_output_malformed(self):
-        """Test parsing malformed output."""
-        output = """Some random text
-Not in expected format
-Total: 100 GB (but with extra text)
-"""
-        worker = RcloneWorker(["rclone", "about", "test:"], "test_remote")
-        result = worker._parse_about_output(output)
+        assert status.remote_name == "test_remote"
+        assert (status.total, status.used, status.free) == ("100 GB", "40 GB", "60 GB")
+        assert status.objects == "Unknown"
+        assert status.error is None
+        assert len(status.last_updated) == len("2024-01-01 12:00:00")
 
-        # Should still extract what it can
-        assert "100 GB (but with extra text)" in result["total"] or result["total"] == "Unknown"
+    def test_parse_about_output_repeat_is_independent(self, parse_worker):
+        """Test that re-parsing identical (cached) output returns a fresh dict."""
+        first = parse_worker._parse_about_output("Total: 100 GB\n")
+        first["total"] = "changed"
+
+        assert parse_worker._parse_about_output("Total: 100 GB\n")["total"] == "100 GB"
 
     @pytest.mark.qt
+    @pytest.mark.xdist_group("rclone_qt")
     def test_run_success(self, qtbot):
         """Test successful rclone command execution."""
-        worker = RcloneWorker(["echo", "Total: 100 GB"], "test_remote")
-        finished_called = False
-        error_called = False
-        result_data = None
-        remote_name = None
-
-        def on_finished(remote, result):
-            nonlocal finished_called, result_data, remote_name
-            finished_called = True
-            remote_name = remote
-            result_data = result
-
-        def on_error(remote, error_msg):
-            nonlocal error_called
-            error_called = True
-
-        worker.finished.connect(on_finished)
-        worker.error.connect(on_error)
-
-        worker.start()
-        qtbot.wait_until(lambda: finished_called or error_called, timeout=5000)
-
-        assert finished_called
-        assert not error_called
+        worker = RcloneWorker(_py("print('Total: 100 GB')"), "test_remote")
+
+        with qtbot.assertNotEmitted(worker.error):
+            with qtbot.waitSignal(worker.finished, timeout=5000) as blocker:
+                worker.start()
+            worker.wait()
+
+        remote_name, result_data = blocker.args
         assert remote_name == "test_remote"
-        assert result_data is not None
+        assert isinstance(result_data, DriveStatus)
+        assert result_data.remote_name == "test_remote"
+        assert result_data.total == "100 GB"
+        assert result_data.used == "Unknown"
+        assert result_data.last_updated != "Never"
 
     @pytest.mark.qt
-    def test_run_error(self, qtbot):
+    @pytest.mark.xdist_group("rclone_qt")
+    def test_run_error(self, qtbot, monkeypatch):
         """Test rclone command execution with error."""
-        # Use a command that will fail
-        worker = RcloneWorker(["false"], "test_remote")
-        finished_called = False
-        error_called = False
-        error_msg = None
-        remote_name = None
-
-        def on_finished(remote, result):
-            nonlocal finished_called
-            finished_called = True
-
-        def on_error(remote, msg):
-            nonlocal error_called, error_msg, remote_name
-            error_called = True
-            remote_name = remote
-            error_msg = msg
-
-        worker.finished.connect(on_finished)
-        worker.error.connect(on_error)
-
-        worker.start()
-        qtbot.wait_until(lambda: finished_called or error_called, timeout=5000)
-
-        assert not finished_called
-        assert error_called
+        # A failing command, without spawning one
+        completed = subprocess.CompletedProcess([], 1, stdout=b"", stderr=b"bad remote")
+        monkeypatch.setattr(rclone.subprocess, "run", lambda *args, **kwargs: completed)
+        worker = RcloneWorker(["rclone", "about", "test:"], "test_remote")
+
+        with qtbot.assertNotEmitted(worker.finished):
+            with qtbot.waitSignal(worker.error, timeout=5000) as blocker:
+                worker.start()
+            worker.wait()
+
+        remote_name, error_msg = blocker.args
         assert remote_name == "test_remote"
-        assert error_msg is not None
+        assert error_msg == "bad remote"
 
     @pytest.mark.qt
+    @pytest.mark.xdist_group("rclone_qt")
     def test_run_timeout(self, qtbot):
         """Test rclone command execution timeout."""
         # Use a command that will hang (sleep longer than timeout)
-        worker = RcloneWorker(["sleep", "60"], "test_remote")
-        error_called = False
-        error_msg = None
-
-        def on_error(remote, msg):
-            nonlocal error_called, error_msg
-            error_called = True
-            error_msg = msg
+        worker = RcloneWorker(
+            _py("import time; time.sleep(60)"), "test_remote", timeout_seconds=0.2
+        )
 
-        worker.error.connect(on_error)
+        with qtbot.waitSignal(worker.error, timeout=5000) as blocker:
+            worker.start()
+        worker.wait()
 
-        worker.start()
-        qtbot.wait_until(lambda: error_called, timeout=35000)  # Wait for timeout
-
-        assert error_called
-        assert "timed out" in error_msg.lower()
+        assert "timed out" in blocker.args[1].lower()
 
     @pytest.mark.qt
-    def test_run_exception(self, qtbot):
+    @pytest.mark.xdist_group("rclone_qt")
+    def test_run_exception(self, qtbot, monkeypatch):
         """Test rclone command execution with exception."""
+
+        def missing(*args, **kwargs):
+            raise FileNotFoundError("nonexistent_command_xyz")
+
+        monkeypatch.setattr(rclone.subprocess, "run", missing)
         worker = RcloneWorker(["nonexistent_command_xyz"], "test_remote")
-        error_called = False
-        error_msg = None
 
-        def on_error(remote, msg):
-            nonlocal error_called, error_msg
-            error_called = True
-            error_msg = msg
+        with qtbot.waitSignal(worker.error, timeout=5000) as blocker:
+            worker.start()
+        worker.wait()
 
-        worker.error.connect(on_error)
+        assert blocker.args == ["test_remote", "nonexistent_command_xyz"]
 
-        worker.start()
-        qtbot.wait_until(lambda: error_called, timeout=5000)
 
-        assert error_called
-        assert error_msg is not None
+class TestRemoteListWorker:
+    """Test suite for RemoteListWorker."""
 
-    def test_parse_about_output_with_colon_in_value(self):
-        """Test parsing output where value contains colon."""
-        output = """Total:   100 GB: Extra info
-Used:    50 GB
-"""
-        worker = RcloneWorker(["rclone", "about", "test:"], "test_remote")
-        result = worker._parse_about_output(output)
-
-        # Should only split on first colon
-        assert "100 GB: Extra info" in result["total"]
-        assert result["used"] == "50 GB"
-
-    def test_parse_about_output_multiple_spaces(self):
-        """Test parsing output with multiple spaces."""
-        output = """Total:     100 GB
-Used:      50 GB
-Free:      50 GB
-"""
-        worker = RcloneWorker(["rclone", "about", "test:"], "test_remote")
-        result = worker._parse_about_output(output)
+    def _run(self, worker):
+        """Run the worker synchronously and collect what it emitted."""
+        emitted = {"remotes": None, "missing": False, "error": None}
+        worker.remotes_ready.connect(lambda remotes: emitted.update(remotes=remotes))
+        worker.rclone_missing.connect(lambda: emitted.update(missing=True))
+        worker.error.connect(lambda msg: emitted.update(error=msg))
+        worker.run()
+        return emitted
+
+    def test_lists_remotes(self, monkeypatch):
+        """Test that listremotes output is parsed into remote names."""
+        completed = subprocess.CompletedProcess([], 0, stdout="gdrive:\nonedrive-work:\n\n")
+        monkeypatch.setattr(rclone.subprocess, "run", lambda *args, **kwargs: completed)
+
+        emitted = self._run(RemoteListWorker())
+
+        assert emitted["remotes"] == ["gdrive", "onedrive-work"]
+        assert emitted["error"] is None
+
+    def test_rclone_missing(self, monkeypatch):
+        """Test that a missing rclone binary emits rclone_missing."""
+
+        def missing(*args, **kwargs):
+            raise FileNotFoundError("rclone")
+
+        monkeypatch.setattr(rclone.subprocess, "run", missing)
+
+        emitted = self._run(RemoteListWorker())
+
+        assert emitted["missing"] is True
+        assert emitted["remotes"] is None
+
+    def test_nonzero_exit(self, monkeypatch):
+        """Test that a failing listremotes emits error with stderr."""
+        completed = subprocess.CompletedProcess([], 1, stdout="", stderr="bad config")
+        monkeypatch.setattr(rclone.subprocess, "run", lambda *args, **kwargs: completed)
+
+        emitted = self._run(RemoteListWorker())
+
+        assert emitted["error"] == "bad config"
+        assert emitted["remotes"] is None
+
+    def test_parse_listremotes_output(self):
+        """Test parsing listremotes output, including names with spaces."""
+        worker = RemoteListWorker()
+        output = "gdrive:\nMy Dropbox:\nbox-2:\n"
+
+        assert worker._parse_listremotes_output(output) == ["gdrive", "My Dropbox", "box-2"]
+
+    def test_parse_listremotes_output_crlf_and_noise(self):
+        """Test that CRLF line endings, blank lines and stray text are handled."""
+        worker = RemoteListWorker()
+        output = "gdrive:\r\n\r\nNOTICE: something\r\nonedrive:\r\n"
+
+        assert worker._parse_listremotes_output(output) == ["gdrive", "onedrive"]
 
-        assert result["total"].strip() == "100 GB"
-        assert result["used"].strip() == "50 GB"
-        assert result["free"].strip() == "50 GB"
+    def test_parse_listremotes_output_empty(self):
+        """Test that empty output yields no remotes."""
+        assert RemoteListWorker()._parse_listremotes_output("") == []
@@ -0,0 +1,121 @@
+"""Tests for run-at-startup (Launch Agent) support."""
+
+import plistlib
+
+import pytest
+
+from check_cloud_drives import startup
+from check_cloud_drives.startup import LAUNCH_AGENT_LABEL, LaunchAgentWorker
+
+
+@pytest.fixture
+def launchctl_calls(monkeypatch):
+    """Record launchctl invocations instead of running them."""
+    calls = []
+    monkeypatch.setattr(startup.subprocess, "run", lambda cmd, **kwargs: calls.append(cmd))
+    return calls
+
+
+class TestLaunchAgentWorker:
+    """Test suite for LaunchAgentWorker."""
+
+    def test_install_with_script(self, tmp_path, launchctl_calls):
+        """Test that enabling writes a plist running run.sh and loads it."""
+        plist_path = tmp_path / "LaunchAgents" / f"{LAUNCH_AGENT_LABEL}.plist"
+        script_path = tmp_path / "run.sh"
+        worker = LaunchAgentWorker(True, plist_path, tmp_path, script_path=script_path)
+
+        worker.run()
+
+        plist = plistlib.loads(plist_path.read_bytes())
+        assert plist["Label"] == LAUNCH_AGENT_LABEL
+        assert plist["ProgramArguments"] == ["/bin/bash", str(script_path)]
+        assert plist["RunAtLoad"] is True
+        assert plist["KeepAlive"] is False
+        assert plist["WorkingDirectory"] == str(tmp_path)
+        assert launchctl_calls == [["launchctl", "load", str(plist_path)]]
+
+    def test_install_with_python_fallback(self, tmp_path, launchctl_calls):
+        """Test that enabling without run.sh uses the Python interpreter."""
+        plist_path = tmp_path / f"{LAUNCH_AGENT_LABEL}.plist"
+        python_path = tmp_path / "python3"
+        worker = LaunchAgentWorker(True, plist_path, tmp_path, python_path=python_path)
+
+        worker.run()
+
+        plist = plistlib.loads(plist_path.read_bytes())
+        assert plist["ProgramArguments"] == [str(python_path), "-m", "check_cloud_drives.main"]
+
+    def test_install_escapes_special_paths(self, tmp_path, launchctl_calls):
+        """Test that paths with XML-special characters round-trip intact."""
+        project_root = tmp_path / "R&D <drives>"
+        plist_path = tmp_path / f"{LAUNCH_AGENT_LABEL}.plist"
+        script_path = project_root / "run.sh"
+        worker = LaunchAgentWorker(True, plist_path, project_root, script_path=script_path)
+
+        worker.run()
+
+        plist = plistlib.loads(plist_path.read_bytes())
+        assert plist["ProgramArguments"][1] == str(script_path)
+        assert plist["WorkingDirectory"] == str(project_root)
+
+    def test_install_unchanged_skips_reload(self, tmp_path, launchctl_calls):
+        """Test that re-enabling with identical content doesn't rewrite or reload."""
+        plist_path = tmp_path / f"{LAUNCH_AGENT_LABEL}.plist"
+        script_path = tmp_path / "run.sh"
+        LaunchAgentWorker(True, plist_path, tmp_path, script_path=script_path).run()
+        mtime = plist_path.stat().st_mtime_ns
+
+        LaunchAgentWorker(True, plist_path, tmp_path, script_path=script_path).run()
+
+        assert plist_path.stat().st_mtime_ns == mtime
+        assert len(launchctl_calls) == 1
+
+    def test_remove_existing(self, tmp_path, launchctl_calls):
+        """Test that disabling unloads and deletes an existing plist."""
+        plist_path = tmp_path / f"{LAUNCH_AGENT_LABEL}.plist"
+        plist_path.write_text("placeholder")
+        worker = LaunchAgentWorker(False, plist_path, tmp_path)
+
+        worker.run()
+
+        assert not plist_path.exists()
+        assert launchctl_calls == [["launchctl", "unload", str(plist_path)]]
+
+    def test_remove_missing_is_noop(self, tmp_path, launchctl_calls):
+        """Test that disabling without a plist does nothing."""
+        plist_path = tmp_path / f"{LAUNCH_AGENT_LABEL}.plist"
+        worker = LaunchAgentWorker(False, plist_path, tmp_path)
+
+        worker.run()
+
+        assert launchctl_calls == []
+
+    def test_launchctl_output_discarded(self, tmp_path, monkeypatch):
+        """Test that launchctl runs with its output sent to DEVNULL."""
+        recorded = []
+        monkeypatch.setattr(
+            startup.subprocess, "run", lambda cmd, **kwargs: recorded.append(kwargs)
+        )
+        plist_path = tmp_path / f"{LAUNCH_AGENT_LABEL}.plist"
+        LaunchAgentWorker(True, plist_path, tmp_path, script_path=tmp_path / "run.sh").run()
+
+        assert recorded[0]["stdout"] is startup.subprocess.DEVNULL
+        assert recorded[0]["stderr"] is startup.subprocess.DEVNULL
+        assert recorded[0]["check"] is False
+
+    def test_error_signal(self, tmp_path, monkeypatch):
+        """Test that failures are reported through the error signal."""
+
+        def fail(cmd, **kwargs):
+            raise OSError("launchctl unavailable")
+
+        monkeypatch.setattr(startup.subprocess, "run", fail)
+        plist_path = tmp_path / f"{LAUNCH_AGENT_LABEL}.plist"
+        worker = LaunchAgentWorker(True, plist_path, tmp_path, script_path=tmp_path / "run.sh")
+        errors = []
+        worker.error.connect(lambda enable, msg: errors.append((enable, msg)))
+
+        worker.run()
+
+        assert errors == [(True, "launchctl unavailable")]
@@ -0,0 +1,61 @@
+"""Tests for MainWindow."""
+
+import pytest
+
+from check_cloud_drives.config import ConfigManager
+from check_cloud_drives.models import DriveConfig
+
+# Skip (rather than error) when PySide6 isn't installed; MainWindow itself is
+# imported inside the fixture so collecting this file stays cheap
+pytest.importorskip("PySide6.QtCore")
+
+# Needs the Qt event loop; deselect with -m "not qt"
+pytestmark = pytest.mark.qt
+
+
+@pytest.fixture
+def config_path(tmp_path, monkeypatch):
+    """Point MainWindow at a config file in a temporary project root."""
+    from check_cloud_drives.ui import window
+
+    monkeypatch.setattr(window, "_PROJECT_ROOT", tmp_path)
+    return tmp_path / "check-cloud-drives.toml"
+
+
+@pytest.fixture
+def main_window(qapp, qtbot, config_path, monkeypatch):
+    """Create a MainWindow that never starts rclone refreshes."""
+    from check_cloud_drives.ui.window import MainWindow
+
+    monkeypatch.setattr(MainWindow, "refresh_all_drives", lambda self: None)
+    main_window = MainWindow()
+    qtbot.addWidget(main_window)
+    return main_window
+
+
+class TestMainWindow:
+    """Test suite for MainWindow."""
+
+    @pytest.fixture(autouse=True)
+    def _drives(self, config_path):
+        """Configure two enabled drives and one disabled drive."""
+        ConfigManager(config_path).set_drives(
+            [
+                DriveConfig("remote1", "Drive 1"),
+                DriveConfig("remote2", "Drive 2"),
+                DriveConfig("hidden", "Hidden Drive", enabled=False),
+            ]
+        )
+
+    def test_cards_only_for_enabled_drives(self, main_window):
+        """Test that disabled drives get no card."""
+        assert list(main_window.drive_cards) == ["remote1", "remote2"]
+
+    def test_remove_card_keeps_disabled_drives(self, main_window, config_path):
+        """Test that removing a card keeps disabled drives in the config."""
+        main_window._remove_card("remote1")
+        main_window._flush_pending_saves()
+
+        drives = ConfigManager(config_path).get_drives()
+        assert [d.remote_name for d in drives] == ["remote2", "hidden"]
+        assert drives[1].enabled is False